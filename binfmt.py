@@ -0,0 +1,36 @@
+"""
+Helpers shared by the memory-mapped binary formats (token_index, stem_table,
+gold_classes): little-endian uint arrays, 2, 4 or 8 bytes wide, read in place
+through a memoryview where the host byte order allows it.
+"""
+import sys
+from array import array
+
+TYPECODES = {2: 'H', 4: 'I', 8: 'Q'}
+
+def pack(values, width):
+    """values as little-endian uints of the given width."""
+    arr = array(TYPECODES[width], values)
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr.tobytes()
+
+def uint_array(buf, pos, count, width):
+    """
+    The count uints at pos in buf and the position after them. On
+    little-endian hosts this is a view into buf, else a byteswapped copy.
+    """
+    end = pos + width * count
+    typecode = TYPECODES[width]
+    if sys.byteorder == 'little':
+        return memoryview(buf)[pos:end].cast(typecode), end
+    arr = array(typecode, buf[pos:end])
+    arr.byteswap()
+    return arr, end
+
+def close_mapped(buf, *views):
+    """Release the views into buf, then close it."""
+    for view in views:
+        if isinstance(view, memoryview):
+            view.release()
+    buf.close()
@@ -0,0 +1,121 @@
+"""
+Optional columnar output of the stemming scripts (--parquet DIR), laid out as
+
+    DIR/tokens/<input file>.parquet   file, position, token, stem, prefix4
+    DIR/metrics.parquet               file, UI, OI, MWC
+
+DIR/tokens is one Parquet dataset, readable in one go with
+pyarrow.dataset.dataset() or pandas.read_parquet().
+
+Each worker writes the token part of the file it stems, in row groups of
+ROW_GROUP_SIZE rows as stems come out of the pipeline, so no output text
+has to be parsed again and unchanged files keep their part between
+incremental runs. pyarrow is imported only when this mode is used.
+"""
+import os
+
+ROW_GROUP_SIZE = 64 * 1024
+TOKENS_DIR = 'tokens'
+METRICS_FILE = 'metrics.parquet'
+
+def require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("--parquet needs pyarrow (pip install pyarrow)")
+    return pa, pq
+
+def token_part_path(folder, fname):
+    return os.path.join(folder, TOKENS_DIR, fname + '.parquet')
+
+class TokenTableWriter:
+    """
+    Writes one input file's tokens and stems to a Parquet part. Pass the
+    token stream through tokens() and the stem stream through stems(); a
+    row group goes out every row_group_size stems.
+    """
+
+    def __init__(self, path, fname, row_group_size=ROW_GROUP_SIZE):
+        pa, pq = require_pyarrow()
+        self._pa = pa
+        self.fname = fname
+        self.row_group_size = row_group_size
+        self.schema = pa.schema([
+            ('file', pa.dictionary(pa.int32(), pa.string())),
+            ('position', pa.int64()),
+            ('token', pa.string()),
+            ('stem', pa.string()),
+            ('prefix4', pa.string()),
+        ])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._tmp_path = path + '.tmp'
+        self._path = path
+        self._writer = pq.ParquetWriter(self._tmp_path, self.schema)
+        self._tokens = []
+        self._stems = []
+        self._written = 0
+
+    def tokens(self, words):
+        """Yield words unchanged, recording each."""
+        for word in words:
+            self._tokens.append(word)
+            yield word
+
+    def stems(self, stems):
+        """Yield stems unchanged, recording each."""
+        for stem in stems:
+            self._stems.append(stem)
+            if len(self._stems) >= self.row_group_size:
+                self._flush()
+            yield stem
+
+    def _flush(self):
+        n = len(self._stems)
+        if not n:
+            return
+        pa = self._pa
+        tokens = self._tokens[:n]
+        table = pa.table({
+            'file': pa.DictionaryArray.from_arrays(pa.array([0] * n, pa.int32()), pa.array([self.fname])),
+            'position': pa.array(range(self._written, self._written + n), pa.int64()),
+            'token': pa.array(tokens, pa.string()),
+            'stem': pa.array(self._stems, pa.string()),
+            'prefix4': pa.array([w[:4] for w in tokens], pa.string()),
+        }, schema=self.schema)
+        self._writer.write_table(table)
+        del self._tokens[:n]
+        self._stems = []
+        self._written += n
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+        os.replace(self._tmp_path, self._path)
+
+    def discard(self):
+        """Close without writing the part, e.g. when the input has to be read again."""
+        self._writer.close()
+        os.remove(self._tmp_path)
+
+def write_metrics(folder, results):
+    """Write the per-file metrics of results as DIR/metrics.parquet."""
+    pa, pq = require_pyarrow()
+    table = pa.table({
+        'file': pa.array([r['Filename'] for r in results], pa.string()),
+        'UI': pa.array([float(r['UI']) for r in results], pa.float64()),
+        'OI': pa.array([float(r['OI']) for r in results], pa.float64()),
+        'MWC': pa.array([float(r['MWC']) for r in results], pa.float64()),
+    })
+    os.makedirs(folder, exist_ok=True)
+    pq.write_table(table, os.path.join(folder, METRICS_FILE))
+
+def prune_token_parts(folder, files):
+    """Remove the token parts of input files that are gone."""
+    tokens_dir = os.path.join(folder, TOKENS_DIR)
+    if not os.path.isdir(tokens_dir):
+        return
+    keep = {fname + '.parquet' for fname in files}
+    for name in os.listdir(tokens_dir):
+        if name.endswith('.parquet') and name not in keep:
+            os.remove(os.path.join(tokens_dir, name))
@@ -0,0 +1,285 @@
+"""
+Shared driver for ecs_stemmer.py and porter_stemmer.py: the command-line
+options, the per-file pipeline, the (parallel) corpus loop, output
+formatting and the final report. Each script only supplies its stemmer,
+stopwords and tokenizer.
+"""
+import argparse
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import columnar_output
+from encoding_detect import detect_encoding, utf8_encoding
+from encoding_manifest import EncodingManifest, content_hasher
+from incremental import IncrementalState, stem_changed
+from stem_cache import StemCache
+from stem_metrics import corpus_metrics, file_metrics, relative_error
+from stem_table import open_table
+from text_normalizer import normalize_for_stemming
+from text_stream import (ascii_compatible, filter_offset_tokens, filter_tokens, normalized_tokens, offset_tokens, read_chunks,
+                         stem_tokens, write_joined)
+from token_index import IndexBuilder, index_path
+
+def format_metrics(ui, oi, mwc):
+    """Metrics table that follows the stemmed words in an output file."""
+    return (
+        "\n\nMetrics:\n"
+        + f"{'Metric':<25}{'Value':>10}\n"
+        + f"{'-'*35}\n"
+        + f"{'Understemming Index (UI)':<25}{ui:>10.2f}\n"
+        + f"{'Overstemming Index (OI)':<25}{oi:>10.2f}\n"
+        + f"{'Mean Word Conflation (MWC)':<25}{mwc:>10.2f}\n"
+    )
+
+def cache_counters(cache):
+    return (cache.hits, cache.misses, cache.evictions)
+
+class StemmingJob:
+    """What every worker needs to know to stem a file of the corpus."""
+
+    def __init__(self, input_folder, output_folder, stemmer, version, tokenize=str.split,
+                 approximate=None, index=False, parquet=None, stem_table=None):
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.stemmer = stemmer
+        self.version = version
+        self.tokenize = tokenize
+        self.approximate = approximate
+        self.index = index
+        self.parquet = parquet
+        self.stem_table = stem_table
+
+# Set up once per worker process by init_worker()
+job = None
+stem = None
+store = None
+manifest = None
+stop_words = set()
+
+def init_worker(setup, stemming_job):
+    """
+    setup() builds the script's stemmer and returns (stem, store,
+    stop_words): a word -> stem callable, the StemStore behind it, to be
+    flushed after each file, and the stopwords to drop.
+    """
+    global job, stem, store, manifest, stop_words
+    job = stemming_job
+    manifest = EncodingManifest(job.input_folder)
+    stem, store, stop_words = setup()
+    if job.stem_table:
+        # Words of the prestemmed lexicon skip the stemmer and the store altogether
+        stem = open_table(job.stem_table, job.stemmer, job.version).wrap(stem)
+    stem = StemCache(stem)
+
+def stem_file(fname):
+    path = os.path.join(job.input_folder, fname)
+    out_path = os.path.join(job.output_folder, fname)
+    before = cache_counters(stem)
+    enc = manifest.lookup(path)
+    if enc is not None:
+        result = stem_stream(fname, path, out_path, enc)
+    else:
+        # A new or changed file is taken for UTF-8 and decoded strictly, so
+        # the one read that stems it also checks it; only a file that turns
+        # out not to be is detected and read again
+        enc = utf8_encoding(path)
+        try:
+            result = stem_stream(fname, path, out_path, enc, errors='strict')
+        except UnicodeDecodeError:
+            enc = detect_encoding(path)
+            before = cache_counters(stem)
+            result = stem_stream(fname, path, out_path, enc)
+        manifest.record(path, enc, digest=result['Digest'])
+    store.flush()
+
+    return {
+        'Filename': fname,
+        **result,
+        'Cache': tuple(a - b for a, b in zip(cache_counters(stem), before)),
+        'Encoding': manifest.entries.get(fname),
+    }
+
+def stem_stream(fname, path, out_path, enc, errors='replace'):
+    """
+    Stem the input file at path, read as enc, into out_path and its
+    sidecars, and return its metrics, corpus-metric accumulator, sidecar
+    paths and content hash. With errors='strict', an input that does not
+    decode raises UnicodeDecodeError and leaves no Parquet part. Anything
+    the report should mention about the file goes in 'Notes'.
+    """
+    sidecars = []
+    notes = []
+    digest = content_hasher()
+
+    # Stream the file through preprocessing, stemming and output so memory
+    # stays bounded by the chunk size and the file's vocabulary
+    with_index = job.index and ascii_compatible(enc)
+    if job.index and not with_index:
+        # Byte offsets cannot be traced in e.g. UTF-16, so such a file gets
+        # no token index and its consumers fall back to re-aligning it
+        notes.append(f"no token index for {enc} input")
+        if os.path.exists(index_path(out_path)):
+            os.remove(index_path(out_path))
+    if with_index:
+        # Same tokens, with the source offset of each for the token index
+        builder = IndexBuilder()
+        tokens = builder.tokens(filter_offset_tokens(
+            offset_tokens(path, enc, normalize_for_stemming, tokenize=job.tokenize, errors=errors, digest=digest),
+            stop_words))
+    else:
+        builder = None
+        tokens = filter_tokens(
+            normalized_tokens(read_chunks(path, enc, errors=errors, digest=digest), normalize_for_stemming,
+                              tokenize=job.tokenize), stop_words)
+    table = None
+    if job.parquet:
+        sidecars.append(columnar_output.token_part_path(job.parquet, fname))
+        table = columnar_output.TokenTableWriter(sidecars[-1], fname)
+        tokens = table.tokens(tokens)
+    w2s = {}
+    stems = stem_tokens(tokens, stem, w2s)
+    if builder is not None:
+        stems = builder.stems(stems)
+    if table is not None:
+        stems = table.stems(stems)
+    try:
+        with open(out_path, 'w', encoding='utf-8') as out:
+            out.write("Stemmed Words:\n")
+            n_tokens = write_joined(out, stems)
+            ui, oi, mwc = file_metrics(list(w2s), list(w2s.values()))
+            out.write(format_metrics(ui, oi, mwc))
+    except UnicodeDecodeError:
+        if table is not None:
+            table.discard()
+        raise
+    if builder is not None:
+        sidecars.append(index_path(out_path))
+        builder.write(sidecars[-1], os.path.getsize(path))
+    if table is not None:
+        table.close()
+    corpus = corpus_metrics(job.approximate)
+    corpus.add(w2s, n_tokens)
+
+    return {
+        'UI': ui,
+        'OI': oi,
+        'MWC': mwc,
+        'Corpus': corpus,
+        'Sidecars': sidecars,
+        'Digest': digest.hexdigest(),
+        'Notes': notes,
+    }
+
+def stem_corpus(files, stem_file, init_worker, workers=None):
+    """
+    Run stem_file(fname) over files and yield its results in the order of
+    files, whatever order the workers finish in.
+
+    With more than one worker the files are spread over a process pool and
+    init_worker() runs once in each worker process, so every worker builds
+    its own stemmer. workers=None uses one worker per CPU.
+    """
+    if not files:
+        return
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(files) > 1:
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            yield from pool.map(stem_file, files, chunksize=chunksize)
+        return
+    init_worker()
+    for fname in files:
+        yield stem_file(fname)
+
+def stemming_parser(description):
+    """Argument parser with the options every stemming script has."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only stem input files that changed since the last run")
+    parser.add_argument('--approximate', type=relative_error, metavar='ERROR', default=None,
+                        help="estimate the corpus-wide metrics in bounded memory, with this "
+                             "relative standard error per distinct count (e.g. 0.01)")
+    parser.add_argument('--index', action='store_true',
+                        help="also write a binary token index (name.txt.idx) next to each output file")
+    parser.add_argument('--parquet', metavar='DIR',
+                        help="also write tokens, stems and per-file metrics as a Parquet dataset in DIR")
+    parser.add_argument('--stem-table', metavar='PATH',
+                        help="look words up in a stem table built by stem_table.py for the same stemmer "
+                             "(e.g. from dictionary.txt or EnglishWords.txt) before stemming them")
+    return parser
+
+def run_stemming(args, setup, input_folder, output_folder, config, tokenize=str.split):
+    """
+    Stem every .txt file of input_folder into output_folder as args, parsed
+    by a stemming_parser(), ask and print the report. config names the
+    stemmer ('stemmer', 'version') and whatever else its output depends on;
+    setup is passed to init_worker() and tokenize splits normalized text.
+    """
+    if args.parquet:
+        columnar_output.require_pyarrow()
+    if args.stem_table:
+        # Fail here rather than in every worker
+        open_table(args.stem_table, config['stemmer'], config['version']).close()
+
+    os.makedirs(output_folder, exist_ok=True)
+    files = sorted(f for f in os.listdir(input_folder) if f.endswith('.txt'))
+    # A stem table gives the stems its stemmer would, so it is not part of config
+    config = {
+        **config,
+        'approximate': args.approximate,
+        'index': args.index,
+        'parquet': os.path.abspath(args.parquet) if args.parquet else None,
+    }
+    state = IncrementalState(output_folder, config)
+    stemming_job = StemmingJob(input_folder, output_folder, config['stemmer'], config['version'], tokenize,
+                               args.approximate, args.index, args.parquet, args.stem_table)
+    init = functools.partial(init_worker, setup, stemming_job)
+    results, corpus = stem_changed(files, input_folder, state,
+                           lambda todo: stem_corpus(todo, stem_file, init, args.workers),
+                           skip_unchanged=args.incremental)
+
+    # Workers only see their own manifest copy; merge what they detected
+    manifest = EncodingManifest(input_folder)
+    manifest.update({r['Filename']: r['Encoding'] for r in results})
+    manifest.save()
+
+    if args.parquet:
+        columnar_output.prune_token_parts(args.parquet, files)
+        columnar_output.write_metrics(args.parquet, results)
+
+    print_report(results, corpus)
+
+def print_report(results, corpus):
+    """corpus is the corpus-metric accumulator of all results merged."""
+    for r in results:
+        for note in r['Notes']:
+            print(f"{r['Filename']}: {note}")
+    df = pd.DataFrame([
+        {'Filename': r['Filename'], 'UI': round(r['UI'],2), 'OI': round(r['OI'],2), 'MWC': round(r['MWC'],2)}
+        for r in results
+    ])
+    print(df.to_string(index=False, justify='right'))
+
+    n_files = len(results)
+    if n_files:
+        print("\nAverages:")
+        print(f"{'Average Understemming Index (UI)':<35}: {sum(r['UI'] for r in results)/n_files:.2f}")
+        print(f"{'Average Overstemming Index (OI)':<35}: {sum(r['OI'] for r in results)/n_files:.2f}")
+        print(f"{'Average Mean Word Conflation (MWC)':<35}: {sum(r['MWC'] for r in results)/n_files:.2f}")
+
+        totals = corpus.finalize()
+        print("\nCorpus-wide:")
+        print(f"{'Total Tokens Analyzed':<35}: {totals['Total_Words']}")
+        print(f"{'Mean Word Conflation (MWC)':<35}: {totals['Mean_Word_Conflation']:.2f}")
+        print(f"{'Overstemming Index (OI)':<35}: {totals['Overstemming_Index']:.4f}")
+        print(f"{'Understemming Index (UI)':<35}: {totals['Understemming_Index']:.4f}")
+        hits, misses, evictions = (sum(c) for c in zip(*(r['Cache'] for r in results)))
+        lookups = hits + misses
+        print(f"\nStem cache: {hits} hits, {misses} misses, "
+              f"{evictions} evictions ({hits / lookups if lookups else 0:.0%} hit rate)")
+    else:
+        print("No files processed.")
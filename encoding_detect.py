@@ -0,0 +1,98 @@
+"""
+Encoding detection shared by the stemming and preprocessing scripts.
+
+Almost every input is UTF-8 (or plain ASCII), which a strict decode of
+the whole file confirms far faster than chardet. chardet only runs when
+that fails, and then only on a bounded sample around the first byte that
+did not decode. A reader that decodes the file anyway can assume
+utf8_encoding() and decode strictly, calling detect_encoding() only if
+that fails, so that the check costs no read of its own.
+"""
+import codecs
+import hashlib
+import chardet
+
+SAMPLE_SIZE = 64 * 1024
+BLOCK_SIZE = 1 << 20
+
+def _chardet(sample):
+    encoding = chardet.detect(sample)['encoding'] or 'utf-8'
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return 'utf-8'
+
+def utf8_encoding(file_path):
+    """'utf-8-sig' if the file starts with a UTF-8 BOM, else 'utf-8'."""
+    with open(file_path, 'rb') as f:
+        return 'utf-8-sig' if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 'utf-8'
+
+def detect_encoding(file_path, sample_size=SAMPLE_SIZE, manifest=None):
+    """
+    Detect the encoding of a file. It is UTF-8 only if all of it decodes
+    strictly, checked block by block in the same read that hashes it for
+    the manifest; otherwise chardet looks at a sample_size sample starting
+    just before the first byte that did not. With an EncodingManifest,
+    unchanged files are not looked at again.
+    """
+    if manifest is not None:
+        encoding = manifest.lookup(file_path)
+        if encoding is not None:
+            return encoding
+    digest = hashlib.blake2b(digest_size=16)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    encoding = None
+    bad = None
+    pos = 0
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            digest.update(block)
+            if not pos and block.startswith(codecs.BOM_UTF8):
+                encoding = 'utf-8-sig'
+            if encoding is None and bad is None:
+                pending = len(decoder.getstate()[0])
+                try:
+                    # final=False tolerates a multi-byte character cut off by the block
+                    decoder.decode(block, final=False)
+                except UnicodeDecodeError as e:
+                    bad = max(0, pos + e.start - pending)
+            pos += len(block)
+        if encoding is None:
+            if bad is None:
+                encoding = 'utf-8'
+            else:
+                f.seek(max(0, bad - sample_size // 2))
+                encoding = _chardet(f.read(sample_size))
+    if manifest is not None:
+        manifest.record(file_path, encoding, digest=digest.hexdigest())
+    return encoding
+
+def read_text(file_path, manifest=None):
+    """
+    Read a file once and return (text, encoding). The file is UTF-8 only if
+    all of it decodes strictly; otherwise chardet looks at a sample starting
+    just before the first byte that did not. Undecodable bytes are replaced,
+    as the scripts always did. With an EncodingManifest, the encoding of an
+    unchanged file is taken from it.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    encoding = manifest.lookup(file_path, raw) if manifest is not None else None
+    if encoding is not None:
+        return raw.decode(encoding, errors='replace'), encoding
+
+    text = None
+    if raw.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+    else:
+        try:
+            text = raw.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            start = max(0, e.start - SAMPLE_SIZE // 2)
+            encoding = _chardet(raw[start:start + SAMPLE_SIZE])
+    if manifest is not None:
+        manifest.record(file_path, encoding, raw)
+    if text is None:
+        text = raw.decode(encoding, errors='replace')
+    return text, encoding
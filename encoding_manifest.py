@@ -0,0 +1,90 @@
+"""
+Per-folder cache of detected file encodings.
+
+Each input folder gets a small JSON sidecar, MANIFEST_NAME, mapping file
+name -> size, mtime, content hash and encoding. A file whose size and
+mtime still match is not looked at again; if only its mtime moved (a copy
+or a touch), the content hash decides.
+"""
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = '.encoding_manifest.json'
+
+def content_hasher():
+    """A hashlib object whose hexdigest() is the content_hash of what it was fed."""
+    return hashlib.blake2b(digest_size=16)
+
+def content_hash(data):
+    h = content_hasher()
+    h.update(data)
+    return h.hexdigest()
+
+def file_hash(file_path, block_size=1 << 20):
+    h = content_hasher()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+class EncodingManifest:
+
+    def __init__(self, folder):
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def lookup(self, file_path, data=None):
+        """
+        Recorded encoding of file_path, or None if the file is new or changed.
+        data is the file's content when the caller has already read it, so
+        a hash check does not read the file again.
+        """
+        entry = self.entries.get(os.path.basename(file_path))
+        if entry is None:
+            return None
+        st = os.stat(file_path)
+        if entry['size'] != st.st_size:
+            return None
+        if entry['mtime_ns'] != st.st_mtime_ns:
+            digest = content_hash(data) if data is not None else file_hash(file_path)
+            if digest != entry['hash']:
+                return None
+            entry['mtime_ns'] = st.st_mtime_ns
+            self.dirty = True
+        return entry['encoding']
+
+    def record(self, file_path, encoding, data=None, digest=None):
+        """data or digest, its content_hash, save reading the file again to hash it."""
+        st = os.stat(file_path)
+        if digest is None:
+            digest = content_hash(data) if data is not None else file_hash(file_path)
+        self.entries[os.path.basename(file_path)] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'hash': digest,
+            'encoding': encoding,
+        }
+        self.dirty = True
+
+    def update(self, entries):
+        """Merge entries recorded elsewhere, e.g. by worker processes."""
+        for name, entry in entries.items():
+            if entry is not None and self.entries.get(name) != entry:
+                self.entries[name] = entry
+                self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
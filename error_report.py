@@ -0,0 +1,126 @@
+"""
+Error report writer shared by the evaluation scripts.
+
+Files are compared one at a time and each file's section goes out in one
+write through a large buffer. The most common errors are counted with a
+Space-Saving counter (Metwally et al., 2005), so memory stays bounded by
+its capacity however many distinct errors the corpus has.
+"""
+import contextlib
+import csv
+import heapq
+from collections import Counter
+
+BUFFER_SIZE = 1 << 20
+
+class SpaceSaving:
+    """
+    Approximate counts of the most frequent keys in at most capacity
+    counters. While fewer than capacity distinct keys have been seen the
+    counts are exact; after that a new key takes over the smallest counter,
+    so a count may overestimate by at most errors[key].
+    """
+
+    def __init__(self, capacity=10_000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self._heap = None  # (count, key), built on the first eviction
+
+    def add(self, key, count=1):
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+        elif len(counts) < self.capacity:
+            counts[key] = count
+            self.errors[key] = 0
+        else:
+            self._replace_min(key, count)
+
+    def update(self, counter):
+        """Add a mapping of key -> count, e.g. a collections.Counter."""
+        for key, count in counter.items():
+            self.add(key, count)
+
+    def _replace_min(self, key, count):
+        heap = self._heap
+        if heap is None:
+            heap = self._heap = [(c, k) for k, c in self.counts.items()]
+            heapq.heapify(heap)
+        # Entries go stale when their key is incremented; refresh them lazily
+        while True:
+            c, k = heapq.heappop(heap)
+            if self.counts[k] == c:
+                break
+            heapq.heappush(heap, (self.counts[k], k))
+        del self.counts[k], self.errors[k]
+        self.counts[key] = c + count
+        self.errors[key] = c
+        heapq.heappush(heap, (c + count, key))
+
+    def top(self, n):
+        """The n largest (key, count) pairs, ties in order of first arrival."""
+        return heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+
+def write_error_report(files, output_file, top_k=10, capacity=10_000, csv_file=None):
+    """
+    Write the error report for files, an iterable of
+    (filename, gold_tokens, stemmed_tokens) or
+    (filename, gold_tokens, stemmed_tokens, alignment). Without an alignment
+    tokens are compared position by position; with a token_align.Alignment
+    the aligned pairs are, errors are numbered by gold position and the
+    section header states the alignment. A stemmed token longer than its
+    gold stem is an UNDER error, any other mismatch an OVER error. With
+    csv_file, every error is also written there as a
+    file,token,gold,stemmed,type row.
+    """
+    error_types = {'UNDER': 0, 'OVER': 0}
+    word_errors = SpaceSaving(capacity)
+
+    with contextlib.ExitStack() as stack:
+        report = stack.enter_context(open(output_file, 'w', encoding='utf-8', buffering=BUFFER_SIZE))
+        rows = None
+        if csv_file:
+            rows = csv.writer(stack.enter_context(
+                open(csv_file, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE)))
+            rows.writerow(['file', 'token', 'gold', 'stemmed', 'type'])
+        report.write("ERROR ANALYSIS REPORT\n")
+        report.write("="*50 + "\n")
+
+        for filename, gold_tokens, stemmed_tokens, *alignment in files:
+            header = f"\nFile: {filename}\n"
+            if alignment:
+                alignment = alignment[0]
+                header += f"Alignment: {alignment.summary()}\n"
+                positions = [i + 1 for i in alignment.gold_positions]
+                gold_tokens, stemmed_tokens = alignment.pairs(gold_tokens, stemmed_tokens)
+            else:
+                positions = range(1, len(gold_tokens) + 1)
+            errors = [
+                (i, gold_word, stemmed_word, "UNDER" if len(stemmed_word) > len(gold_word) else "OVER")
+                for i, gold_word, stemmed_word in zip(positions, gold_tokens, stemmed_tokens)
+                if stemmed_word != gold_word
+            ]
+            report.write(header + "-"*50 + "\n" + "".join([
+                f"Token {i}: {gold_word} → {stemmed_word} ({error_type})\n"
+                for i, gold_word, stemmed_word, error_type in errors
+            ]))
+            # Count per file first so the counter sees each distinct error once
+            word_errors.update(Counter(f"{gold_word}→{stemmed_word}" for _, gold_word, stemmed_word, _ in errors))
+            under = sum(1 for error in errors if error[3] == "UNDER")
+            error_types['UNDER'] += under
+            error_types['OVER'] += len(errors) - under
+            if rows is not None:
+                rows.writerows((filename, *error) for error in errors)
+
+        # Summary statistics
+        report.write("\n\nSUMMARY STATISTICS\n")
+        report.write("="*50 + "\n")
+        report.write(f"Total Errors: {sum(error_types.values())}\n")
+        report.write(f"Understemming Errors: {error_types['UNDER']}\n")
+        report.write(f"Overstemming Errors: {error_types['OVER']}\n")
+
+        # Most common errors
+        report.write(f"\nTOP {top_k} MOST COMMON ERRORS\n")
+        for error, count in word_errors.top(top_k):
+            report.write(f"{error}: {count} occurrences\n")
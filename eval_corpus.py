@@ -0,0 +1,104 @@
+"""
+Gold-standard and stemmed-output folders, read once and one file at a time.
+
+An EvaluationCorpus only lists file names up front. Iterating it yields a
+CorpusFile per gold file whose text and tokens are read on first access
+and kept only as long as the CorpusFile is, so metrics and the error
+report can share one read of each file without the corpus ever being
+held in memory as a whole. Stems are taken from an output file's token
+index (token_index.py) when it has an up-to-date one.
+"""
+import functools
+import os
+import re
+from token_index import load_index
+
+# ecs_stemmer.py and porter_stemmer.py wrap the stems in a header and a metrics table
+OUTPUT_HEADER = "Stemmed Words:\n"
+OUTPUT_METRICS = "\n\nMetrics:\n"
+
+class CorpusFile:
+
+    def __init__(self, name, gold_path, result_path):
+        self.name = name
+        self.gold_path = gold_path
+        self.result_path = result_path
+
+    @property
+    def has_result(self):
+        return self.result_path is not None and os.path.exists(self.result_path)
+
+    @functools.cached_property
+    def gold_text(self):
+        with open(self.gold_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @functools.cached_property
+    def gold_tokens(self):
+        return self.gold_text.split()
+
+    @functools.cached_property
+    def gold_offsets(self):
+        """Byte offset of each gold token in the (UTF-8) gold file."""
+        offsets = []
+        text = self.gold_text
+        pos = prev = 0
+        for m in re.finditer(r'\S+', text):
+            pos += len(text[prev:m.start()].encode('utf-8'))
+            offsets.append(pos)
+            prev = m.start()
+        return offsets
+
+    @functools.cached_property
+    def index(self):
+        return load_index(self.result_path) if self.has_result else None
+
+    @property
+    def source_offsets(self):
+        """
+        Source offsets of the stemmed tokens from the token index, if the
+        index was built from this gold file (same size), else None.
+        """
+        if self.index is None or self.index.source_size != os.path.getsize(self.gold_path):
+            return None
+        return self.index.offsets()
+
+    @functools.cached_property
+    def stemmed_tokens(self):
+        if self.index is not None:
+            return self.index.stems()
+        with open(self.result_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if text.startswith(OUTPUT_HEADER):
+            text = text[len(OUTPUT_HEADER):].split(OUTPUT_METRICS, 1)[0]
+        return text.split()
+
+class EvaluationCorpus:
+
+    def __init__(self, gold_folder, result_folder=None, filenames=None):
+        """
+        filenames restricts the corpus to those gold files, e.g. one shard;
+        by default it is every .txt file of gold_folder.
+        """
+        self.gold_folder = gold_folder
+        self.result_folder = result_folder
+        if filenames is None:
+            filenames = [f for f in os.listdir(gold_folder) if f.endswith(".txt")]
+        self.filenames = list(filenames)
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def __iter__(self):
+        for name in self.filenames:
+            result_path = os.path.join(self.result_folder, name) if self.result_folder else None
+            yield CorpusFile(name, os.path.join(self.gold_folder, name), result_path)
+
+    def matched(self):
+        """The files that have a stemmed counterpart in result_folder."""
+        return (f for f in self if f.has_result)
+
+    def pairs(self):
+        """Yield (filename, gold_tokens, stemmed_tokens) for each matched file."""
+        for f in self.matched():
+            yield f.name, f.gold_tokens, f.stemmed_tokens
@@ -1,125 +1,112 @@
+import argparse
 import os
-from collections import defaultdict
+from error_report import write_error_report
+from eval_corpus import EvaluationCorpus
+from stem_metrics import GoldMetrics, load_accumulators, save_accumulator, select_shard
+from token_align import align
 
-def load_gold_standard(gold_folder="BIND preprocessed"):
-    gold_data = {}
-    for filename in os.listdir(gold_folder):
-        if filename.endswith(".txt"):
-            with open(os.path.join(gold_folder, filename), 'r', encoding='utf-8') as f:
-                content = f.read().split()
-                gold_data[filename] = content
-    return gold_data
+def aligned_files(corpus, stop_words=frozenset()):
+    """
+    Yield (filename, gold_tokens, stemmed_tokens, alignment) for each matched
+    file, so that gold and stemmed tokens are compared by where the stems
+    came from rather than by position. stop_words are those the stemming
+    pipeline dropped, if the output has only the tokens it kept.
+    """
+    for f in corpus.matched():
+        source_offsets = f.source_offsets
+        alignment = align(f.gold_tokens, f.stemmed_tokens, stop_words, source_offsets=source_offsets,
+                          gold_offsets=f.gold_offsets if source_offsets is not None else None)
+        yield f.name, f.gold_tokens, f.stemmed_tokens, alignment
 
-def load_stemmed_results(result_folder="hasil_stemming"):
-    stemmed_data = {}
-    for filename in os.listdir(result_folder):
-        if filename.endswith(".txt"):
-            with open(os.path.join(result_folder, filename), 'r', encoding='utf-8') as f:
-                content = f.read().split()
-                stemmed_data[filename] = content
-    return stemmed_data
+def accumulate_metrics(corpus, stop_words=frozenset()):
+    """
+    GoldMetrics over the matched files of an EvaluationCorpus; shards of a
+    corpus can be accumulated separately, even on other machines, and
+    merged exactly.
+    """
+    metrics = GoldMetrics()
+    for _, gold_tokens, stemmed_tokens, alignment in aligned_files(corpus, stop_words):
+        metrics.update(*alignment.pairs(gold_tokens, stemmed_tokens))
+    return metrics
 
-def evaluate_stemming_performance(gold_folder, result_folder):
-    gold_standard = load_gold_standard(gold_folder)
-    stemmed_results = load_stemmed_results(result_folder)
-    
-    total_tokens = 0
-    understemming = 0
-    overstemming = 0
-    correct = 0
-    consistency_groups = defaultdict(set)
-    
-    for filename in gold_standard:
-        if filename not in stemmed_results:
-            continue
-            
-        gold_tokens = gold_standard[filename]
-        stemmed_tokens = stemmed_results[filename]
-        
-        for gold_word, stemmed_word in zip(gold_tokens, stemmed_tokens):
-            total_tokens += 1
-            if stemmed_word == gold_word:
-                correct += 1
-            elif len(stemmed_word) > len(gold_word):
-                understemming += 1
-            else:
-                overstemming += 1
-                
-            consistency_groups[stemmed_word].add(gold_word)
-    
-    # Hitung metrik evaluasi
-    UI = understemming / total_tokens
-    OI = overstemming / total_tokens
-    
-    # Hitung MWC (Mean Word Conflation)
-    conflation_sum = 0
-    for stem, words in consistency_groups.items():
-        conflation_sum += len(words)
-    
-    MWC = conflation_sum / len(consistency_groups) if consistency_groups else 0
-    
-    return {
-        'Total_Tokens': total_tokens,
-        'Understemming_Index': UI,
-        'Overstemming_Index': OI,
-        'Mean_Word_Conflation': MWC
-    }
+def evaluate_stemming_performance(gold_folder, result_folder, stop_words=frozenset()):
+    return accumulate_metrics(EvaluationCorpus(gold_folder, result_folder), stop_words).finalize()
 
-def generate_error_report(gold_folder, result_folder, output_file="error_report_ecs.txt"):
-    gold_standard = load_gold_standard(gold_folder)
-    stemmed_results = load_stemmed_results(result_folder)
-    
-    with open(output_file, 'w', encoding='utf-8') as report:
-        report.write("ERROR ANALYSIS REPORT\n")
-        report.write("="*50 + "\n")
-        
-        error_types = defaultdict(int)
-        word_errors = defaultdict(int)
-        
-        for filename in gold_standard:
-            if filename not in stemmed_results:
-                continue
-                
-            gold_tokens = gold_standard[filename]
-            stemmed_tokens = stemmed_results[filename]
-            
-            report.write(f"\nFile: {filename}\n")
-            report.write("-"*50 + "\n")
-            
-            for i, (gold_word, stemmed_word) in enumerate(zip(gold_tokens, stemmed_tokens)):
-                if stemmed_word != gold_word:
-                    error_type = "UNDER" if len(stemmed_word) > len(gold_word) else "OVER"
-                    error_types[error_type] += 1
-                    word_errors[f"{gold_word}→{stemmed_word}"] += 1
-                    
-                    report.write(f"Token {i+1}: {gold_word} → {stemmed_word} ({error_type})\n")
-        
-        # Summary statistics
-        report.write("\n\nSUMMARY STATISTICS\n")
-        report.write("="*50 + "\n")
-        report.write(f"Total Errors: {sum(error_types.values())}\n")
-        report.write(f"Understemming Errors: {error_types.get('UNDER', 0)}\n")
-        report.write(f"Overstemming Errors: {error_types.get('OVER', 0)}\n")
-        
-        # Most common errors
-        report.write("\nTOP 10 MOST COMMON ERRORS\n")
-        for error, count in sorted(word_errors.items(), key=lambda x: x[1], reverse=True)[:10]:
-            report.write(f"{error}: {count} occurrences\n")
+def generate_error_report(gold_folder, result_folder, output_file="error_report_ecs.txt", csv_file=None,
+                          stop_words=frozenset()):
+    write_error_report(aligned_files(EvaluationCorpus(gold_folder, result_folder), stop_words),
+                       output_file, csv_file=csv_file)
+
+def evaluate_and_report(corpus, output_file="error_report_ecs.txt", csv_file=None, stop_words=frozenset()):
+    """
+    Metrics and error report from a single read of each file. The results
+    also count files by alignment method, the aligned pairs whose stem
+    cannot be their word's and the tokens left unaligned.
+    """
+    metrics = GoldMetrics()
+    alignment_stats = {'index': 0, 'one-to-one': 0, 'pipeline': 0, 'diff': 0, 'incompatible': 0,
+                       'gold_only': 0, 'stemmed_only': 0}
+
+    def files():
+        for name, gold_tokens, stemmed_tokens, alignment in aligned_files(corpus, stop_words):
+            metrics.update(*alignment.pairs(gold_tokens, stemmed_tokens))
+            alignment_stats[alignment.method] += 1
+            alignment_stats['incompatible'] += alignment.incompatible
+            alignment_stats['gold_only'] += alignment.gold_only
+            alignment_stats['stemmed_only'] += alignment.stemmed_only
+            yield name, gold_tokens, stemmed_tokens, alignment
+
+    write_error_report(files(), output_file, csv_file=csv_file)
+    return {**metrics.finalize(), 'Alignment': alignment_stats}
 
 
 if __name__ == "__main__":
     gold_folder = "BIND preprocessed"  # Folder berisi file teks dengan stem benar
     result_folder = "hasil_stemming"  # Folder output stemming
-    
-    results = evaluate_stemming_performance(gold_folder, result_folder)
-    
-    print("\nEVALUATION RESULTS:")
-    print("="*50)
-    print(f"Total Tokens Analyzed: {results['Total_Tokens']}")
-    print(f"Understemming Index (UI): {results['Understemming_Index']:.4f}")
-    print(f"Overstemming Index (OI): {results['Overstemming_Index']:.4f}")
-    print(f"Mean Word Conflation (MWC): {results['Mean_Word_Conflation']:.4f}")
-    
-    # Generate detailed error report
-    generate_error_report(gold_folder, result_folder)
-    print("\nError report generated: error_report_ecs.txt")
\ No newline at end of file
+    stopwords_path = "stopwords.txt"  # Stopwords yang dibuang oleh ecs_stemmer.py, jika ada
+
+    parser = argparse.ArgumentParser(description="Evaluate ECS stemming against the gold standard.")
+    parser.add_argument('--shard', metavar='K/N',
+                        help="only evaluate shard K of N and save its accumulator with --save")
+    parser.add_argument('--save', metavar='PATH', help="where --shard writes its accumulator")
+    parser.add_argument('--merge', metavar='PATH', nargs='+',
+                        help="merge accumulators saved by --shard runs and print the results")
+    parser.add_argument('--report-csv', metavar='PATH',
+                        help="also write every error as a CSV row to PATH")
+    args = parser.parse_args()
+
+    stop_words = frozenset()
+    if os.path.exists(stopwords_path):
+        with open(stopwords_path, encoding="utf-8") as f:
+            stop_words = frozenset(w.strip() for w in f)
+
+    if args.shard:
+        if not args.save:
+            parser.error("--shard needs --save")
+        shard = select_shard(EvaluationCorpus(gold_folder).filenames, args.shard)
+        metrics = accumulate_metrics(EvaluationCorpus(gold_folder, result_folder, shard), stop_words)
+        save_accumulator(metrics, args.save)
+        print(f"Shard {args.shard} saved to {args.save}")
+    else:
+        if args.merge:
+            results = load_accumulators(GoldMetrics.from_dict, args.merge).finalize()
+        else:
+            # Metrics and the detailed error report share one read of each file
+            results = evaluate_and_report(EvaluationCorpus(gold_folder, result_folder),
+                                          csv_file=args.report_csv, stop_words=stop_words)
+
+        print("\nEVALUATION RESULTS:")
+        print("="*50)
+        print(f"Total Tokens Analyzed: {results['Total_Tokens']}")
+        print(f"Understemming Index (UI): {results['Understemming_Index']:.4f}")
+        print(f"Overstemming Index (OI): {results['Overstemming_Index']:.4f}")
+        print(f"Mean Word Conflation (MWC): {results['Mean_Word_Conflation']:.4f}")
+        if 'Alignment' in results:
+            stats = results['Alignment']
+            print(f"Alignment: {stats['index']} indexed, {stats['one-to-one']} one-to-one, {stats['pipeline']} pipeline, "
+                  f"{stats['diff']} diff-aligned files; {stats['incompatible']} incompatible pairs; "
+                  f"{stats['gold_only']} gold-only and "
+                  f"{stats['stemmed_only']} stemmed-only tokens left out")
+
+        if not args.merge:
+            print("\nError report generated: error_report_ecs.txt")
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Gold-standard semantic classes used to evaluate PorterCore.porter_stem.
+
+Classes are kept as text in EnglishClass.txt, one set literal per line.
+For large gold standards they can also be converted to a compact binary
+file (python gold_classes.py) that loads without building any Python sets:
+
+    header         magic, format version, integer width, word count,
+                   class count, blob size
+    word_offsets   uint[n_words + 1]      word i is blob[off[i]:off[i + 1]]
+    word_class     uint[n_words]          first class containing word i
+    class_offsets  uint[n_classes + 1]    class c is members[off[c]:off[c + 1]]
+    members        uint[...]              word ids of each class
+    blob           utf-8 words, sorted
+
+Integers are little-endian, 2 bytes wide when every value fits, else 4.
+"""
+import mmap
+import os
+import re
+import struct
+from bisect import bisect_left
+from binfmt import close_mapped, pack, uint_array
+from functools import lru_cache
+
+CLASS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EnglishClass.txt")
+BINARY_FILE = os.path.splitext(CLASS_FILE)[0] + ".bin"
+
+_WORD = re.compile(r"'([^']*)'")
+_HEADER = struct.Struct("<4sHHIII")
+_MAGIC = b"GOLD"
+_VERSION = 1
+
+@lru_cache(maxsize=None)
+def load_classes(path=CLASS_FILE):
+    """
+    Read gold classes written one set literal per line, e.g. { 'act', 'acted' },
+    and return them as a tuple of frozensets. Each path is parsed only once.
+    """
+    with open(path, encoding='utf-8') as f:
+        return tuple(frozenset(_WORD.findall(line)) for line in f if line.strip())
+
+def write_binary(classes, path=BINARY_FILE):
+    """Write classes (an iterable of word sets) in the binary gold format."""
+    classes = [sorted(cls) for cls in classes]
+    words = sorted({w for cls in classes for w in cls})
+    word_id = {w: i for i, w in enumerate(words)}
+
+    word_class = [0] * len(words)
+    seen = [False] * len(words)
+    class_offsets = [0]
+    members = []
+    for class_id, cls in enumerate(classes):
+        for w in cls:
+            i = word_id[w]
+            if not seen[i]:
+                seen[i] = True
+                word_class[i] = class_id
+            members.append(i)
+        class_offsets.append(len(members))
+
+    encoded = [w.encode('utf-8') for w in words]
+    word_offsets = [0]
+    for b in encoded:
+        word_offsets.append(word_offsets[-1] + len(b))
+    blob = b"".join(encoded)
+    width = 2 if max(len(blob), len(members), len(classes)) < 1 << 16 else 4
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, width, len(words), len(classes), len(blob)))
+        for values in (word_offsets, word_class, class_offsets, members):
+            f.write(pack(values, width))
+        f.write(blob)
+
+class GoldClasses:
+    """
+    Read-only view over a binary gold file, memory-mapped.
+
+    word -> class lookups binary-search the sorted word table and
+    class -> words lookups decode only that class, so nothing is
+    materialized up front. Iterating yields each class as a frozenset,
+    so a GoldClasses can stand in for the tuple from load_classes().
+    """
+
+    def __init__(self, path=BINARY_FILE):
+        with open(path, 'rb') as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, width, n_words, n_classes, blob_len = _HEADER.unpack_from(self._buf)
+        if magic != _MAGIC or version != _VERSION or width not in (2, 4):
+            raise ValueError(f"{path} is not a version {_VERSION} gold class file")
+        self.n_words = n_words
+        self.n_classes = n_classes
+        self._width = width
+
+        pos = _HEADER.size
+        self._word_offsets, pos = self._array(pos, n_words + 1)
+        self._word_class, pos = self._array(pos, n_words)
+        self._class_offsets, pos = self._array(pos, n_classes + 1)
+        self._members, pos = self._array(pos, self._class_offsets[n_classes])
+        self._blob = memoryview(self._buf)[pos:pos + blob_len]
+
+    def _array(self, pos, count):
+        return uint_array(self._buf, pos, count, self._width)
+
+    def word(self, word_id):
+        return str(self._blob[self._word_offsets[word_id]:self._word_offsets[word_id + 1]], 'utf-8')
+
+    def words(self):
+        return (self.word(i) for i in range(self.n_words))
+
+    def class_of(self, word):
+        """Id of the first class containing word, or None."""
+        i = bisect_left(range(self.n_words), word, key=self.word)
+        if i < self.n_words and self.word(i) == word:
+            return self._word_class[i]
+        return None
+
+    def words_in(self, class_id):
+        start, end = self._class_offsets[class_id], self._class_offsets[class_id + 1]
+        return [self.word(self._members[j]) for j in range(start, end)]
+
+    def class_index(self):
+        """word -> first class id for every word, as build_class_index() returns."""
+        return dict(zip(self.words(), self._word_class))
+
+    def __len__(self):
+        return self.n_classes
+
+    def __iter__(self):
+        return (frozenset(self.words_in(c)) for c in range(self.n_classes))
+
+    def close(self):
+        close_mapped(self._buf, self._word_offsets, self._word_class, self._class_offsets, self._members, self._blob)
+
+def load_gold():
+    """Gold classes from the binary file when it is up to date, else from the text file."""
+    if os.path.exists(BINARY_FILE) and os.path.getmtime(BINARY_FILE) >= os.path.getmtime(CLASS_FILE):
+        return GoldClasses(BINARY_FILE)
+    return load_classes()
+
+if __name__ == "__main__":
+    classes = load_classes()
+    write_binary(classes)
+    print(f"Wrote {len(classes)} classes to {BINARY_FILE}")
@@ -0,0 +1,130 @@
+"""
+HyperLogLog distinct-count sketch (Flajolet et al., 2007).
+
+A sketch of precision p keeps at most 2**p one-byte registers whatever the
+number of items added, and estimates the number of distinct items with a relative
+standard error of about 1.04 / sqrt(2**p). Sketches of the same precision
+merge exactly: the merged sketch is the one the union would have built.
+"""
+import base64
+import hashlib
+import math
+import numpy as np
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+def precision_for(error):
+    """Smallest precision whose relative standard error is at most error."""
+    if not 0 < error < 1:
+        raise ValueError("error must be between 0 and 1")
+    p = math.ceil(math.log2((1.04 / error) ** 2))
+    return min(max(p, MIN_PRECISION), MAX_PRECISION)
+
+def hash64(item):
+    return int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class HyperLogLog:
+    """
+    Registers are kept sparse, as register -> rank, until more than
+    1/SPARSE_FRACTION of them are set, so a sketch of a few hundred items
+    (one file's vocabulary) stays about that small in memory and in
+    to_dict() however high its precision.
+    """
+
+    SPARSE_FRACTION = 8
+
+    def __init__(self, precision=14):
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f"precision must be in [{MIN_PRECISION}, {MAX_PRECISION}]")
+        self.p = precision
+        self.m = 1 << precision
+        self.sparse = {}
+        self.registers = None
+
+    @property
+    def error(self):
+        return 1.04 / math.sqrt(self.m)
+
+    def _densify(self):
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+        if self.sparse:
+            self.registers[np.fromiter(self.sparse, dtype=np.int64, count=len(self.sparse))] = \
+                np.fromiter(self.sparse.values(), dtype=np.uint8, count=len(self.sparse))
+        self.sparse = None
+
+    def _check_sparse(self):
+        if self.sparse is not None and len(self.sparse) > self.m // self.SPARSE_FRACTION:
+            self._densify()
+
+    def update(self, items):
+        """Add an iterable of strings."""
+        p = self.p
+        rest = 64 - p
+        registers = self.registers if self.sparse is None else self.sparse
+        for item in items:
+            h = hash64(item)
+            idx = h >> rest
+            # Position of the first 1-bit in the remaining 64 - p bits
+            rank = rest - (h & ((1 << rest) - 1)).bit_length() + 1
+            if self.sparse is not None:
+                if rank > registers.get(idx, 0):
+                    registers[idx] = rank
+            elif rank > registers[idx]:
+                registers[idx] = rank
+        self._check_sparse()
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError(f"cannot merge sketches of precision {self.p} and {other.p}")
+        if other.sparse is None:
+            if self.sparse is not None:
+                self._densify()
+            np.maximum(self.registers, other.registers, out=self.registers)
+        elif self.sparse is not None:
+            sparse = self.sparse
+            for idx, rank in other.sparse.items():
+                if rank > sparse.get(idx, 0):
+                    sparse[idx] = rank
+            self._check_sparse()
+        elif other.sparse:
+            idx = np.fromiter(other.sparse, dtype=np.int64, count=len(other.sparse))
+            ranks = np.fromiter(other.sparse.values(), dtype=np.uint8, count=len(other.sparse))
+            np.maximum.at(self.registers, idx, ranks)
+        return self
+
+    def count(self):
+        m = self.m
+        if self.sparse is not None:
+            ranks = np.fromiter(self.sparse.values(), dtype=np.int64, count=len(self.sparse))
+            zeros = m - len(ranks)
+            harmonic = zeros + np.ldexp(1.0, -ranks).sum()
+        else:
+            zeros = m - np.count_nonzero(self.registers)
+            harmonic = np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / harmonic
+        # Small cardinalities: linear counting over the empty registers
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return float(estimate)
+
+    def to_dict(self):
+        if self.sparse is not None:
+            idx = np.fromiter(self.sparse, dtype='<u4', count=len(self.sparse))
+            ranks = np.fromiter(self.sparse.values(), dtype=np.uint8, count=len(self.sparse))
+            return {'p': self.p,
+                    'indices': base64.b64encode(idx.tobytes()).decode('ascii'),
+                    'ranks': base64.b64encode(ranks.tobytes()).decode('ascii')}
+        return {'p': self.p, 'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, d):
+        sketch = cls(d['p'])
+        if 'registers' in d:
+            sketch.sparse = None
+            sketch.registers = np.frombuffer(base64.b64decode(d['registers']), dtype=np.uint8).copy()
+        else:
+            idx = np.frombuffer(base64.b64decode(d['indices']), dtype='<u4')
+            ranks = np.frombuffer(base64.b64decode(d['ranks']), dtype=np.uint8)
+            sketch.sparse = dict(zip(idx.tolist(), ranks.tolist()))
+        return sketch
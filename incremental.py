@@ -0,0 +1,155 @@
+"""
+Incremental re-stemming: remember what each output file was built from.
+
+The output folder gets a STATE_NAME sidecar holding a hash of the stemmer
+configuration and, per input file, its size, mtime, content hash, per-file
+metrics, corpus-metric accumulator and the sidecar files (token index,
+Parquet part) stemming it wrote. An input file whose hash is unchanged,
+under the same configuration and with its output file and those sidecars
+still present, is not stemmed again; its recorded metrics are reused for
+the averages and its accumulator for the corpus-wide metrics. Only a file
+whose mtime moved at the same size is read to be hashed; a file that is
+stemmed is hashed by the read that stems it.
+
+The recorded accumulators are also the corpus-wide metrics of record:
+evaluation scripts merge them (recorded_corpus) instead of stemming the
+corpus a second time.
+"""
+import hashlib
+import json
+import os
+from encoding_manifest import file_hash
+from stem_metrics import corpus_metrics, corpus_metrics_from_dict
+
+STATE_NAME = '.stem_state.json'
+
+def config_hash(config):
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+class IncrementalState:
+
+    def __init__(self, output_folder, config=None):
+        """config=None takes the recorded files whatever configuration they were stemmed with."""
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, STATE_NAME)
+        self.config = config_hash(config)
+        self.files = {}
+        self._stats = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+            if config is None or state.get('config') == self.config:
+                self.files = state['files']
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    def lookup(self, fname, digest):
+        """Recorded metrics for fname if its input hash is digest, else None."""
+        entry = self.files.get(fname)
+        if entry is None or entry['hash'] != digest or 'corpus' not in entry:
+            return None
+        paths = [os.path.join(self.output_folder, fname), *entry.get('sidecars', [])]
+        if not all(os.path.exists(p) for p in paths):
+            return None
+        # Same content under a new mtime (a copy or a touch): remember the
+        # new one, so that the next run does not hash the file again
+        entry['size'], entry['mtime_ns'] = self._stats[fname]
+        return dict(entry['metrics'])
+
+    def accumulator(self, fname):
+        """The recorded corpus-metric accumulator of fname."""
+        return corpus_metrics_from_dict(self.files[fname]['corpus'])
+
+    def stat(self, fname, path):
+        st = os.stat(path)
+        self._stats[fname] = (st.st_size, st.st_mtime_ns)
+        return self._stats[fname]
+
+    def digest(self, fname, path):
+        """
+        Content hash of the input file fname at path, as far as it can match
+        the recorded one: the recorded one while its size and mtime are the
+        recorded ones, so that it is not read, and None if fname has no
+        record or another size, so that only stemming it reads it.
+        """
+        entry = self.files.get(fname)
+        size, mtime_ns = self.stat(fname, path)
+        if entry is None or entry.get('size') != size:
+            return None
+        if entry.get('mtime_ns') == mtime_ns:
+            return entry['hash']
+        return file_hash(path)
+
+    def record(self, fname, result):
+        """Record the result of stemming fname, with the content hash ('Digest') of what it read."""
+        size, mtime_ns = self._stats[fname]
+        self.files[fname] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'hash': result['Digest'],
+            'metrics': {'UI': result['UI'], 'OI': result['OI'], 'MWC': result['MWC']},
+            'corpus': result['Corpus'].to_dict(),
+            'sidecars': result.get('Sidecars', []),
+        }
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'config': self.config, 'files': self.files}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+def recorded_corpus(input_folder, output_folder, files):
+    """
+    The corpus-metric accumulators recorded for files, input files of
+    input_folder, by the last stemming run into output_folder, merged.
+    Raises SystemExit if a file was not stemmed or has changed since.
+    """
+    state = IncrementalState(output_folder)
+    corpus = None
+    for fname in files:
+        entry = state.files.get(fname)
+        if entry is None or 'corpus' not in entry or \
+                entry['hash'] != state.digest(fname, os.path.join(input_folder, fname)):
+            raise SystemExit(f"{fname} has not been stemmed into {output_folder!r} since it last "
+                             f"changed; stem {input_folder!r} again first")
+        acc = state.accumulator(fname)
+        corpus = acc if corpus is None else corpus.merge(acc)
+    return corpus if corpus is not None else corpus_metrics()
+
+def stem_changed(files, input_folder, state, run, skip_unchanged=True):
+    """
+    Call run(changed_files) for the files that need stemming and return
+    (results, corpus): a result for every file in files, in order, and the
+    corpus-metric accumulators of them all merged into one. run may yield
+    its results lazily; each one is recorded in state, so a later run can
+    skip the file, and its accumulator is folded into corpus as it arrives,
+    so only one accumulator is held at a time. Results of skipped files
+    carry their recorded metrics, zero cache counters and no notes.
+    """
+    reused = {}
+    for fname in files:
+        path = os.path.join(input_folder, fname)
+        if not skip_unchanged:
+            state.stat(fname, path)
+            continue
+        recorded = state.lookup(fname, state.digest(fname, path))
+        if recorded is not None:
+            reused[fname] = {'Filename': fname, **recorded, 'Cache': (0, 0, 0), 'Encoding': None, 'Notes': []}
+
+    fresh = iter(run([f for f in files if f not in reused]))
+    results = []
+    corpus = None
+    for fname in files:
+        if fname in reused:
+            result = reused[fname]
+            acc = state.accumulator(fname)
+        else:
+            result = next(fresh)
+            state.record(fname, result)
+            acc = result.pop('Corpus')
+        corpus = acc if corpus is None else corpus.merge(acc)
+        results.append(result)
+    # Forget input files that are gone
+    state.files = {f: state.files[f] for f in files if f in state.files}
+    state.save()
+    return results, corpus
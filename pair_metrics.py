@@ -0,0 +1,47 @@
+"""
+Pair counting for gold-class stemming evaluation (PorterCore.py).
+
+All counts come from a class x stem contingency table, using C(n, 2)
+arithmetic over its cells and margins instead of enumerating word pairs.
+"""
+from collections import Counter
+
+def pairs(n):
+    return n * (n - 1) // 2
+
+def build_class_index(classes):
+    """Map every word to the id (position) of the first class that contains it."""
+    index = {}
+    for class_id, cls in enumerate(classes):
+        for word in cls:
+            index.setdefault(word, class_id)
+    return index
+
+def contingency_table(word_to_stem, class_index):
+    """Count words per (class id, stem) cell."""
+    return Counter((class_index[w], s) for w, s in word_to_stem.items())
+
+def pair_counts(table):
+    """
+    Derive pair counts from a contingency table:
+    total_pairs  - pairs within a class
+    true_pairs   - pairs within a class that share a stem
+    understems   - pairs within a class with different stems
+    overstems    - pairs sharing a stem but from different classes
+    """
+    class_sizes = Counter()
+    stem_sizes = Counter()
+    same_cell = 0
+    for (class_id, stem), n in table.items():
+        class_sizes[class_id] += n
+        stem_sizes[stem] += n
+        same_cell += pairs(n)
+
+    total_pairs = sum(pairs(n) for n in class_sizes.values())
+    stem_pairs = sum(pairs(n) for n in stem_sizes.values())
+    return {
+        'total_pairs': total_pairs,
+        'true_pairs': same_cell,
+        'understems': total_pairs - same_cell,
+        'overstems': stem_pairs - same_cell,
+    }
@@ -1,22 +1,7 @@
 import os
-import re
-import string
-import chardet
-
-def detect_encoding(file_path):
-    """Detect the encoding of a file."""
-    with open(file_path, "rb") as f:
-        raw_data = f.read()
-        if raw_data.startswith(b'\xef\xbb\xbf'):
-            return 'utf-8-sig'
-        result = chardet.detect(raw_data)
-        if result['encoding'] in ['ascii', 'Windows-1252', 'Windows-1254']:
-            try:
-                raw_data.decode('utf-8')
-                return 'utf-8'
-            except UnicodeDecodeError:
-                pass
-        return result['encoding'] or 'utf-8'
+from encoding_detect import read_text
+from encoding_manifest import EncodingManifest
+from text_normalizer import normalize_document
 
 def preprocess_text(text):
     """
@@ -27,29 +12,8 @@ def preprocess_text(text):
     4. Menghapus multiple spaces
     5. Menghapus karakter khusus
     """
-    # Mengubah ke lowercase
-    text = text.lower()
-    
-    # Menghapus URL
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
-    
-    # Menghapus tag HTML jika ada
-    text = re.sub(r'<.*?>', '', text)
-    
-    # Menghapus tanda baca
-    text = text.translate(str.maketrans('', '', string.punctuation))
-    
-    # Menghapus angka
-    text = re.sub(r'\d+', '', text)
-    
-    # Menghapus karakter khusus dan non-ASCII
-    text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-    
-    # Menghapus multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Menghapus whitespace di awal dan akhir
-    return text.strip()
+    # Semua langkah di atas dikerjakan dalam satu kali scan
+    return normalize_document(text)
 
 def preprocess_bind_folder(folder_path="BIND_original", backup=True):
     """
@@ -68,17 +32,16 @@ def preprocess_bind_folder(folder_path="BIND_original", backup=True):
     total_files = len(txt_files)
     
     print(f"Memproses {total_files} file di folder {folder_path}...")
+
+    # Encoding yang sudah terdeteksi pada run sebelumnya tidak dideteksi ulang
+    manifest = EncodingManifest(folder_path)
     
     for i, filename in enumerate(txt_files, 1):
         file_path = os.path.join(folder_path, filename)
         
         try:
-            # Deteksi encoding file
-            encoding = detect_encoding(file_path)
-            
-            # Baca file dengan encoding yang sesuai
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                content = f.read()
+            # Baca file sekali, encoding dideteksi sekaligus
+            content, encoding = read_text(file_path, manifest)
             
             # Buat backup jika diperlukan
             if backup:
@@ -92,12 +55,14 @@ def preprocess_bind_folder(folder_path="BIND_original", backup=True):
             # Tulis kembali ke file asli
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(preprocessed_content)
+            manifest.record(file_path, 'utf-8', preprocessed_content.encode('utf-8'))
             
             print(f"[{i}/{total_files}] Berhasil memproses {filename}")
             
         except Exception as e:
             print(f"[{i}/{total_files}] Gagal memproses {filename}: {str(e)}")
     
+    manifest.save()
     print(f"\nSelesai! Total {total_files} file telah diproses.")
     if backup:
         print(f"File asli telah dicadangkan di folder {backup_folder}")
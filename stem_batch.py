@@ -0,0 +1,23 @@
+"""
+Batch stemming: a batch of tokens is reduced to its vocabulary, each
+distinct word is stemmed once and the stems are broadcast back through an
+integer index array (inverse[i] is the vocabulary position of token i).
+Running text repeats a small vocabulary heavily, so this calls the stemmer
+and touches its cache once per word instead of once per token.
+"""
+import numpy as np
+import pandas as pd
+
+def factorize_tokens(tokens):
+    """Return (vocabulary, inverse): the distinct tokens in order of first occurrence and each token's position in it."""
+    inverse, vocabulary = pd.factorize(np.fromiter(tokens, dtype=object, count=len(tokens)))
+    return vocabulary.tolist(), inverse
+
+def stem_batch_unique(stem, tokens):
+    """
+    Stem each distinct token once. Returns (vocabulary, unique_stems,
+    inverse), where unique_stems[k] is the stem of vocabulary[k], for
+    callers such as the metrics code that only need the vocabulary.
+    """
+    vocabulary, inverse = factorize_tokens(tokens)
+    return vocabulary, [stem(w) for w in vocabulary], inverse
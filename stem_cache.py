@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+class StemCache:
+    """
+    Memoize a stemmer callable such as Sastrawi's stemmer.stem,
+    NLTK's PorterStemmer().stem or PorterCore.porter_stem.
+
+    At most max_size words are kept (None means unbounded); once full, the
+    least recently used word is evicted. hits, misses and evictions count
+    what happened since the cache was created or last cleared.
+    """
+
+    def __init__(self, stem_func, max_size=100_000):
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive or None")
+        self.stem_func = stem_func
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, word):
+        cache = self._cache
+        try:
+            stem = cache[word]
+        except KeyError:
+            self.misses += 1
+            stem = self.stem_func(word)
+            cache[word] = stem
+            if self.max_size is not None and len(cache) > self.max_size:
+                cache.popitem(last=False)
+                self.evictions += 1
+            return stem
+        self.hits += 1
+        cache.move_to_end(word)
+        return stem
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,278 @@
+"""
+UI/OI/MWC for stemmed token streams.
+
+Per file, each distinct word is reduced to the integer code of its stem and of its
+4-character prefix (pd.factorize), and the words-per-stem and
+stems-per-prefix counts come from np.bincount and np.unique over those
+code arrays, so no Python set is built per stem or prefix. Corpus-wide
+figures come from mergeable accumulators: exact ones, and sketch-based
+ones of bounded size for corpora whose vocabulary does not fit in memory.
+"""
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from hyperloglog import HyperLogLog, precision_for
+
+def distinct_per_group(groups, values, n_groups):
+    """Number of distinct values for each group code, as an array of length n_groups."""
+    n_values = int(values.max()) + 1
+    pairs = np.unique(groups.astype(np.int64) * n_values + values)
+    return np.bincount(pairs // n_values, minlength=n_groups)
+
+def file_metrics(tokens, stems):
+    """
+    Return (UI, OI, MWC) for one file's tokens and their stems:
+    MWC  distinct words per stem, averaged over stems
+    OI   share of stems that conflate more than one word
+    UI   share of 4-character prefixes whose words got more than one stem
+    """
+    if len(tokens) == 0:
+        return 0, 0, 0
+    # One C-level pass reduces the stream to its vocabulary (the last stem
+    # of a word wins, as before); everything after that is vocabulary-sized
+    w2s = dict(zip(tokens, stems))
+    word_stems, stem_uniques = pd.factorize(np.fromiter(w2s.values(), dtype=object, count=len(w2s)))
+    prefix_codes, prefix_uniques = pd.factorize(np.array([w[:4] for w in w2s], dtype=object))
+
+    words_per_stem = np.bincount(word_stems, minlength=len(stem_uniques))
+    stems_per_prefix = distinct_per_group(prefix_codes, word_stems, len(prefix_uniques))
+
+    mwc = words_per_stem.mean()
+    oi = np.count_nonzero(words_per_stem > 1) / len(words_per_stem)
+    ui = np.count_nonzero(stems_per_prefix > 1) / len(stems_per_prefix)
+    return float(ui), float(oi), float(mwc)
+
+class CorpusMetrics:
+    """
+    Corpus-wide UI/OI/MWC, accumulated file by file or shard by shard.
+
+    Holds the token count and the set of distinct (word, stem) pairs, which
+    is all the corpus-wide numbers depend on, so accumulators built for
+    separate files, processes or machines merge exactly; to_dict() gives a
+    JSON-serializable form to ship them in. finalize() uses the definitions
+    of evaluation_porter_stemmer.evaluate_stemming_performance.
+    """
+
+    def __init__(self):
+        self.total_tokens = 0
+        self.pairs = set()
+
+    def update(self, tokens, stems):
+        """Add a token stream and the stem of each token."""
+        self.total_tokens += len(tokens)
+        self.pairs.update(zip(tokens, stems))
+
+    def add(self, w2s, n_tokens):
+        """Add a file whose n_tokens tokens stemmed as recorded in w2s."""
+        self.total_tokens += n_tokens
+        self.pairs.update(w2s.items())
+
+    def merge(self, other):
+        self.total_tokens += other.total_tokens
+        self.pairs |= other.pairs
+        return self
+
+    def finalize(self):
+        unique_stems = len({s for _, s in self.pairs})
+        prefix_stems = {(w[:4], s) for w, s in self.pairs if len(w) >= 4}
+        prefixes = len({p for p, _ in prefix_stems})
+        # Each stem with k words adds k - 1 overstemmed pairs; each prefix
+        # with k stems adds k - 1 understemmed pairs
+        overstem_pairs = len(self.pairs) - unique_stems
+        understem_pairs = len(prefix_stems) - prefixes
+        return {
+            'Total_Words': self.total_tokens,
+            'Unique_Stems': unique_stems,
+            'Mean_Word_Conflation': self.total_tokens / unique_stems if unique_stems else 0,
+            'Overstemming_Index': overstem_pairs / unique_stems if unique_stems else 0,
+            'Understemming_Index': understem_pairs / unique_stems if unique_stems else 0,
+        }
+
+    def to_dict(self):
+        return {'tokens': self.total_tokens, 'pairs': sorted(self.pairs)}
+
+    @classmethod
+    def from_dict(cls, d):
+        acc = cls()
+        acc.total_tokens = d['tokens']
+        acc.pairs = {(w, s) for w, s in d['pairs']}
+        return acc
+
+class ApproxCorpusMetrics:
+    """
+    CorpusMetrics estimated in bounded memory. The four distinct counts
+    behind the corpus-wide figures (stems, (word, stem) pairs, prefixes and
+    (prefix, stem) pairs) are each kept in a HyperLogLog sketch with a
+    relative standard error of about error, whatever the corpus size. MWC
+    inherits that relative error; OI and UI are differences of two
+    estimates, so their error is absolute and a few times larger.
+    """
+
+    def __init__(self, error=0.01):
+        p = precision_for(error)
+        self.total_tokens = 0
+        self.stems = HyperLogLog(p)
+        self.pairs = HyperLogLog(p)
+        self.prefixes = HyperLogLog(p)
+        self.prefix_stems = HyperLogLog(p)
+
+    def update(self, tokens, stems):
+        """Add a token stream and the stem of each token."""
+        self.total_tokens += len(tokens)
+        self._add_pairs(set(zip(tokens, stems)))
+
+    def add(self, w2s, n_tokens):
+        """Add a file whose n_tokens tokens stemmed as recorded in w2s."""
+        self.total_tokens += n_tokens
+        self._add_pairs(w2s.items())
+
+    def _add_pairs(self, pairs):
+        self.stems.update({s for _, s in pairs})
+        self.pairs.update(f"{w}\0{s}" for w, s in pairs)
+        long_words = {(w[:4], s) for w, s in pairs if len(w) >= 4}
+        self.prefixes.update({p for p, _ in long_words})
+        self.prefix_stems.update(f"{p}\0{s}" for p, s in long_words)
+
+    def merge(self, other):
+        self.total_tokens += other.total_tokens
+        for name in ('stems', 'pairs', 'prefixes', 'prefix_stems'):
+            getattr(self, name).merge(getattr(other, name))
+        return self
+
+    def finalize(self):
+        unique_stems = self.stems.count()
+        # A difference of two estimates may dip below zero when the true
+        # index is close to it
+        overstem_pairs = max(self.pairs.count() - unique_stems, 0)
+        understem_pairs = max(self.prefix_stems.count() - self.prefixes.count(), 0)
+        return {
+            'Total_Words': self.total_tokens,
+            'Unique_Stems': round(unique_stems),
+            'Mean_Word_Conflation': self.total_tokens / unique_stems if unique_stems else 0,
+            'Overstemming_Index': overstem_pairs / unique_stems if unique_stems else 0,
+            'Understemming_Index': understem_pairs / unique_stems if unique_stems else 0,
+        }
+
+    def to_dict(self):
+        d = {'tokens': self.total_tokens}
+        for name in ('stems', 'pairs', 'prefixes', 'prefix_stems'):
+            d[name] = getattr(self, name).to_dict()
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        acc = cls()
+        acc.total_tokens = d['tokens']
+        for name in ('stems', 'pairs', 'prefixes', 'prefix_stems'):
+            setattr(acc, name, HyperLogLog.from_dict(d[name]))
+        return acc
+
+def relative_error(value):
+    """argparse type of --approximate: a relative error between 0 and 1."""
+    error = float(value)
+    if not 0 < error < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not between 0 and 1")
+    return error
+
+def corpus_metrics(error=None):
+    """An empty corpus-wide accumulator: exact, or approximate with the given error."""
+    return CorpusMetrics() if error is None else ApproxCorpusMetrics(error)
+
+def corpus_metrics_from_dict(d):
+    """Rebuild either kind of corpus-wide accumulator from its to_dict()."""
+    return (ApproxCorpusMetrics if 'stems' in d else CorpusMetrics).from_dict(d)
+
+class GoldMetrics:
+    """
+    UI/OI/MWC of stemmed tokens against gold-standard stems, as in
+    evaluation_ecs_stemmer.evaluate_stemming_performance: a stemmed token
+    longer than its gold stem is understemmed, a shorter or different one
+    overstemmed, and MWC counts the distinct gold stems per stemmed word.
+    Mergeable and serializable like CorpusMetrics.
+    """
+
+    def __init__(self):
+        self.total_tokens = 0
+        self.correct = 0
+        self.understemming = 0
+        self.overstemming = 0
+        self.pairs = set()  # (stemmed word, gold stem)
+
+    def update(self, gold_tokens, stemmed_tokens):
+        """Compare two aligned token streams, up to the shorter of the two."""
+        for gold_word, stemmed_word in zip(gold_tokens, stemmed_tokens):
+            self.total_tokens += 1
+            if stemmed_word == gold_word:
+                self.correct += 1
+            elif len(stemmed_word) > len(gold_word):
+                self.understemming += 1
+            else:
+                self.overstemming += 1
+            self.pairs.add((stemmed_word, gold_word))
+
+    def merge(self, other):
+        self.total_tokens += other.total_tokens
+        self.correct += other.correct
+        self.understemming += other.understemming
+        self.overstemming += other.overstemming
+        self.pairs |= other.pairs
+        return self
+
+    def finalize(self):
+        groups = len({s for s, _ in self.pairs})
+        return {
+            'Total_Tokens': self.total_tokens,
+            'Understemming_Index': self.understemming / self.total_tokens if self.total_tokens else 0,
+            'Overstemming_Index': self.overstemming / self.total_tokens if self.total_tokens else 0,
+            'Mean_Word_Conflation': len(self.pairs) / groups if groups else 0,
+        }
+
+    def to_dict(self):
+        return {
+            'tokens': self.total_tokens,
+            'correct': self.correct,
+            'under': self.understemming,
+            'over': self.overstemming,
+            'pairs': sorted(self.pairs),
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        acc = cls()
+        acc.total_tokens = d['tokens']
+        acc.correct = d['correct']
+        acc.understemming = d['under']
+        acc.overstemming = d['over']
+        acc.pairs = {(s, g) for s, g in d['pairs']}
+        return acc
+
+def select_shard(files, spec):
+    """The files of shard 'K/N': every N-th file of the sorted list, from the K-th (0-based)."""
+    k, n = (int(x) for x in spec.split('/'))
+    if not 0 <= k < n:
+        raise ValueError(f"invalid shard {spec!r}: need 0 <= K < N")
+    return sorted(files)[k::n]
+
+def save_accumulator(acc, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(acc.to_dict(), f)
+
+def merge_all(accumulators):
+    """Merge accumulators into a new one of the same kind, or None if there are none."""
+    accumulators = iter(accumulators)
+    first = next(accumulators, None)
+    if first is None:
+        return None
+    total = type(first).from_dict(first.to_dict())
+    for acc in accumulators:
+        total.merge(acc)
+    return total
+
+def load_accumulators(from_dict, paths):
+    """Load accumulators saved by save_accumulator, rebuild them with from_dict and merge them."""
+    accumulators = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            accumulators.append(from_dict(json.load(f)))
+    return merge_all(accumulators)
@@ -0,0 +1,101 @@
+import hashlib
+import sqlite3
+from importlib import metadata
+
+def package_version(name):
+    """Installed version of a distribution, used to key stored stems."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+def file_version(path):
+    """Content hash of an in-repo stemmer's source, so edits invalidate stored stems."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+class StemStore:
+    """
+    Persistent word -> stem store kept in a SQLite table.
+
+    Rows are keyed by stemmer name and version, so upgrading a stemmer never
+    reuses stems it did not produce. Existing rows for that stemmer are read
+    on first lookup; new stems are buffered and appended every flush_every
+    words and on close().
+    """
+
+    def __init__(self, path, stemmer_name, stemmer_version, flush_every=1000):
+        self.path = path
+        self.stemmer_name = stemmer_name
+        self.stemmer_version = stemmer_version
+        self.flush_every = flush_every
+        self._conn = None
+        self._stems = None
+        self._pending = []
+
+    def _load(self):
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stems ("
+            " stemmer TEXT NOT NULL, version TEXT NOT NULL,"
+            " word TEXT NOT NULL, stem TEXT NOT NULL,"
+            " PRIMARY KEY (stemmer, version, word)) WITHOUT ROWID"
+        )
+        rows = self._conn.execute(
+            "SELECT word, stem FROM stems WHERE stemmer = ? AND version = ?",
+            (self.stemmer_name, self.stemmer_version),
+        )
+        self._stems = dict(rows)
+
+    def get(self, word):
+        if self._stems is None:
+            self._load()
+        return self._stems.get(word)
+
+    def put(self, word, stem):
+        if self._stems is None:
+            self._load()
+        if word in self._stems:
+            return
+        self._stems[word] = stem
+        self._pending.append((self.stemmer_name, self.stemmer_version, word, stem))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def wrap(self, stem_func):
+        """Return a stemmer callable that consults the store before stem_func."""
+        def stem(word):
+            result = self.get(word)
+            if result is None:
+                result = stem_func(word)
+                self.put(word, result)
+            return result
+        return stem
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO stems (stemmer, version, word, stem) VALUES (?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+            self._stems = None
+
+    def __len__(self):
+        if self._stems is None:
+            self._load()
+        return len(self._stems)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
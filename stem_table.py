@@ -0,0 +1,230 @@
+"""
+Precomputed stem lookup table for a lexicon such as dictionary.txt or
+EnglishWords.txt.
+
+The whole lexicon is stemmed once ahead of time (python stem_table.py) into
+a compact binary file that is memory-mapped at run time, so stemming an
+in-vocabulary word is a hash lookup with no rule evaluation; only words
+outside the lexicon fall through to the stemmer itself:
+
+    header        magic, format version, integer width, word count,
+                  stem count, slot count, blob size, stemmer name size,
+                  version size
+    stemmer       utf-8 stemmer name, then its version
+    word_offsets  uint[n_words + 1]     word i is blob[off[i]:off[i + 1]]
+    stem_offsets  uint[n_stems + 1]     stem j is blob[off[j]:off[j + 1]]
+    word_stem     uint[n_words]         stem id of word i
+    slots         uint[n_slots]         word id + 1 (0 for none), at
+                                        crc32(word) mod n_slots or the
+                                        next free slot after it
+    blob          utf-8 words, sorted, then stems, sorted
+
+Integers are little-endian, 2 bytes wide when every value fits, else 4.
+The slot count is a power of two at least twice the word count.
+Lexicon entries are normalized and split like corpus text
+(normalize_for_stemming), so multi-word entries add each of their words.
+"""
+import argparse
+import functools
+import mmap
+import os
+import struct
+import zlib
+from binfmt import close_mapped, pack, uint_array
+from text_normalizer import normalize_for_stemming
+
+SUFFIX = '.stab'
+
+_HEADER = struct.Struct("<4sHHIIIIHH")
+_MAGIC = b"STAB"
+_VERSION = 1
+
+def _offsets(encoded, start=0):
+    offsets = [start]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    return offsets
+
+def _slots(encoded):
+    n_slots = 1
+    while n_slots < 2 * len(encoded):
+        n_slots *= 2
+    mask = n_slots - 1
+    slots = [0] * n_slots
+    for i, b in enumerate(encoded):
+        h = zlib.crc32(b) & mask
+        while slots[h]:
+            h = (h + 1) & mask
+        slots[h] = i + 1
+    return slots
+
+def read_lexicon(path):
+    """The distinct words of a lexicon file, one entry per line."""
+    words = set()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            words.update(normalize_for_stemming(line).split())
+    return words
+
+def write_table(w2s, path, stemmer, version):
+    """Write w2s, a word -> stem mapping made by stemmer at version, as a stem table."""
+    words = sorted(w2s)
+    stems = sorted(set(w2s.values()))
+    stem_id = {s: j for j, s in enumerate(stems)}
+
+    encoded_words = [w.encode('utf-8') for w in words]
+    encoded_stems = [s.encode('utf-8') for s in stems]
+    word_offsets = _offsets(encoded_words)
+    stem_offsets = _offsets(encoded_stems, word_offsets[-1])
+    blob = b"".join(encoded_words) + b"".join(encoded_stems)
+    slots = _slots(encoded_words)
+    width = 2 if max(len(blob), len(words) + 1, len(stems)) < 1 << 16 else 4
+    name, ver = stemmer.encode('utf-8'), version.encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, width, len(words), len(stems), len(slots),
+                             len(blob), len(name), len(ver)))
+        f.write(name + ver)
+        f.write(pack(word_offsets, width))
+        f.write(pack(stem_offsets, width))
+        f.write(pack((stem_id[w2s[w]] for w in words), width))
+        f.write(pack(slots, width))
+        f.write(blob)
+
+class StemTable:
+    """Read-only, memory-mapped view over a stem table."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, width, n_words, n_stems, n_slots,
+         blob_len, name_len, ver_len) = _HEADER.unpack_from(self._buf)
+        if magic != _MAGIC or version != _VERSION or width not in (2, 4) or n_slots & (n_slots - 1):
+            raise ValueError(f"{path} is not a version {_VERSION} stem table")
+        self.n_words = n_words
+        self.n_stems = n_stems
+        self._width = width
+
+        pos = _HEADER.size
+        self.stemmer = self._buf[pos:pos + name_len].decode('utf-8')
+        pos += name_len
+        self.version = self._buf[pos:pos + ver_len].decode('utf-8')
+        pos += ver_len
+        self._word_offsets, pos = self._array(pos, n_words + 1)
+        self._stem_offsets, pos = self._array(pos, n_stems + 1)
+        self._word_stem, pos = self._array(pos, n_words)
+        self._slots, pos = self._array(pos, n_slots)
+        self._mask = n_slots - 1
+        self._blob = memoryview(self._buf)[pos:pos + blob_len]
+
+    def _array(self, pos, count):
+        return uint_array(self._buf, pos, count, self._width)
+
+    def word(self, word_id):
+        return str(self._blob[self._word_offsets[word_id]:self._word_offsets[word_id + 1]], 'utf-8')
+
+    def stem_of(self, stem_id):
+        return str(self._blob[self._stem_offsets[stem_id]:self._stem_offsets[stem_id + 1]], 'utf-8')
+
+    def get(self, word):
+        """The stem of word if it is in the table, else None."""
+        b = word.encode('utf-8')
+        offsets, slots, mask = self._word_offsets, self._slots, self._mask
+        h = zlib.crc32(b) & mask
+        while True:
+            i = slots[h] - 1
+            if i < 0:
+                return None
+            if self._blob[offsets[i]:offsets[i + 1]] == b:
+                return self.stem_of(self._word_stem[i])
+            h = (h + 1) & mask
+
+    def wrap(self, stem_func):
+        """Return a stemmer callable that looks words up in the table before stem_func."""
+        def stem(word):
+            result = self.get(word)
+            if result is None:
+                result = stem_func(word)
+            return result
+        return stem
+
+    def __len__(self):
+        return self.n_words
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def close(self):
+        close_mapped(self._buf, self._word_offsets, self._stem_offsets, self._word_stem, self._slots, self._blob)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_table(path, stemmer, version):
+    """
+    The stem table at path, refusing one that was built by another stemmer
+    or stemmer version than the one it is meant to stand in for.
+    """
+    table = StemTable(path)
+    if (table.stemmer, table.version) != (stemmer, version):
+        found = f"{table.stemmer} {table.version}"
+        table.close()
+        raise SystemExit(f"{path} was built with {found}, not {stemmer} {version}; rebuild it")
+    return table
+
+def lexicon_stemmer(name):
+    """Return (stem, version) for a stemmer as named by ecs_stemmer.py and porter_stemmer.py."""
+    from stem_store import file_version, package_version
+    if name == 'sastrawi':
+        from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+        return StemmerFactory().create_stemmer().stem, package_version('Sastrawi')
+    if name == 'porter-core':
+        import PorterCore
+        return PorterCore.porter_stem, file_version(PorterCore.__file__)
+    from nltk.stem import PorterStemmer
+    return PorterStemmer().stem, package_version('nltk')
+
+# Set up once per worker process by init_worker()
+stem = None
+
+def init_worker(stemmer_name):
+    global stem
+    stem, _ = lexicon_stemmer(stemmer_name)
+
+def stem_words(words):
+    return [stem(w) for w in words]
+
+def stem_lexicon(words, stemmer_name, workers=None, batch_size=1000):
+    """word -> stem for every word, stemmed batch_size words at a time across worker processes."""
+    # corpus_stemming imports this module for open_table
+    from corpus_stemming import stem_corpus
+    words = sorted(words)
+    batches = [words[i:i + batch_size] for i in range(0, len(words), batch_size)]
+    init = functools.partial(init_worker, stemmer_name)
+    w2s = {}
+    for batch, stems in zip(batches, stem_corpus(batches, stem_words, init, workers)):
+        w2s.update(zip(batch, stems))
+    return w2s
+
+def main():
+    parser = argparse.ArgumentParser(description="Stem a lexicon ahead of time into a stem lookup table.")
+    parser.add_argument('lexicon', help="word list, one entry per line (e.g. dictionary.txt, EnglishWords.txt)")
+    parser.add_argument('--stemmer', choices=['sastrawi', 'nltk', 'porter-core'], required=True,
+                        help="stemmer the table stands in for: sastrawi for ecs_stemmer.py, "
+                             "nltk or porter-core for porter_stemmer.py")
+    parser.add_argument('-o', '--output', help=f"table to write (default: the lexicon name with {SUFFIX})")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.lexicon)[0] + SUFFIX
+    _, version = lexicon_stemmer(args.stemmer)
+    w2s = stem_lexicon(read_lexicon(args.lexicon), args.stemmer, args.workers)
+    write_table(w2s, output, args.stemmer, version)
+    print(f"Wrote {len(w2s)} {args.stemmer} stems to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Parity of text_normalizer with the chains of re.sub passes it replaced.
+Run with python -m pytest.
+"""
+import random
+import re
+import string
+import pytest
+from text_normalizer import normalize_document, normalize_for_stemming
+
+# The preprocess() of ecs_stemmer.py and porter_stemmer.py before text_normalizer
+def reference_for_stemming(text):
+    text = text.lower()
+    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = re.sub(r'<.*?>', '', text)
+    text = re.sub(r'[^a-z\s]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+# The preprocess_text() of preprocessing_bind.py and preprocessing_bing.py before text_normalizer
+def reference_document(text):
+    text = text.lower()
+    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = re.sub(r'<.*?>', '', text)
+    text = text.translate(str.maketrans('', '', string.punctuation))
+    text = re.sub(r'\d+', '', text)
+    text = re.sub(r'[^\x00-\x7F]+', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+CASES = [
+    "",
+    "   ",
+    "Kata-kata BIASA, dengan tanda baca!",
+    "lihat https://contoh.com/a?b=1 dan www.contoh.org/x lagi",
+    "<p>paragraf</p> <a href=\"x\">tautan</a>",
+    "<a href=\"http://x.com/a>b\">teks</a> sesudah",
+    "<a href=http://x.com/a>b c>d",
+    "<www.x.com>y> z",
+    "< bukan tag",
+    "a < b > c",
+    "tag <terbuka\nbaris> baru",
+    "baris\r\nwindows\rlama",
+    "tab\tdan\x0bvertical\x0cfeed",
+    "Rp 10.000 pada 2024, 3x lipat",
+    "café naïve résumé Ünïcödé",
+    "非ASCII 文字 dan emoji 🙂 di tengah",
+    "spasi tak putus",
+    "HTTP://BESAR.COM/PATH dan WWW.BESAR.COM",
+    "<<ganda>> <>kosong",
+    "akhir dengan tag <b",
+]
+
+ALPHABET = [
+    "a", "b", "Z", " ", "  ", "\t", "\n", "\r", "<", ">", "</", "/>", "<p>", "http://", "https://",
+    "www.", ".com", "1", "42", ",", ".", "!", "'", "\"", "=", "é", "Ü", "文", " ", "-", "_",
+]
+
+def random_texts(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+
+@pytest.mark.parametrize("text", CASES)
+def test_stemming_cases(text):
+    assert normalize_for_stemming(text) == reference_for_stemming(text)
+
+@pytest.mark.parametrize("text", CASES)
+def test_document_cases(text):
+    assert normalize_document(text) == reference_document(text)
+
+def test_stemming_random():
+    for text in random_texts(20_000, seed=1):
+        assert normalize_for_stemming(text) == reference_for_stemming(text), repr(text)
+
+def test_document_random():
+    for text in random_texts(20_000, seed=2):
+        assert normalize_document(text) == reference_document(text), repr(text)
@@ -0,0 +1,26 @@
+"""
+offset_tokens against the normalized_tokens(read_chunks()) stream it traces.
+Run with python -m pytest.
+"""
+import codecs
+import random
+import pytest
+from text_normalizer import normalize_for_stemming
+from text_stream import normalized_tokens, offset_tokens, read_chunks
+
+def words(n, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(1, 12))) for _ in range(n)]
+
+@pytest.mark.parametrize("encoding, bom", [("utf-8", b""), ("utf-8-sig", codecs.BOM_UTF8), ("utf-8-sig", b"")])
+def test_single_line_across_chunks(tmp_path, encoding, bom):
+    # One line of 200 words, many times the chunk size
+    path = tmp_path / "line.txt"
+    path.write_bytes(bom + " ".join(words(200)).encode("utf-8"))
+    raw = path.read_bytes()
+
+    expected = list(normalized_tokens(read_chunks(path, encoding, chunk_size=64), normalize_for_stemming))
+    pairs = list(offset_tokens(path, encoding, normalize_for_stemming, chunk_size=64))
+    assert [token for token, _ in pairs] == expected == words(200)
+    for token, offset in pairs:
+        assert raw[offset:offset + len(token)] == token.encode("utf-8")
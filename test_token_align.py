@@ -0,0 +1,57 @@
+"""
+Recovery of token_align.align() when stems are missing from the output.
+Run with python -m pytest.
+"""
+import os
+import random
+import time
+import pytest
+from eval_corpus import EvaluationCorpus
+from token_align import align, consistent
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GOLD_FOLDER = os.path.join(HERE, "BIND preprocessed")
+RESULT_FOLDER = os.path.join(HERE, "hasil_stemming")
+
+@pytest.fixture(scope="module")
+def first_file():
+    name = sorted(os.listdir(RESULT_FOLDER))[0]
+    f = next(f for f in EvaluationCorpus(GOLD_FOLDER, RESULT_FOLDER, [name]).matched())
+    return f.gold_tokens, f.stemmed_tokens
+
+def test_one_to_one(first_file):
+    gold_tokens, stemmed_tokens = first_file
+    alignment = align(gold_tokens, stemmed_tokens)
+    assert alignment.method == 'one-to-one'
+    assert alignment.gold_only == alignment.stemmed_only == 0
+
+@pytest.mark.parametrize("removed", [12, 30])
+def test_recovers_removed_stems(first_file, removed):
+    gold_tokens, stemmed_tokens = first_file
+    stemmed_tokens = stemmed_tokens[:100] + stemmed_tokens[100 + removed:]
+    alignment = align(gold_tokens, stemmed_tokens)
+    assert alignment.method == 'diff'
+    assert alignment.stemmed_positions == list(range(len(stemmed_tokens)))
+    assert alignment.gold_positions == [j if j < 100 else j + removed for j in range(len(stemmed_tokens))]
+    assert (alignment.gold_only, alignment.stemmed_only, alignment.incompatible) == (removed, 0, 0)
+    assert consistent(gold_tokens, stemmed_tokens, alignment.gold_positions, alignment.stemmed_positions)
+
+def test_wrong_stems_are_counted_apart(first_file):
+    gold_tokens, stemmed_tokens = first_file
+    stemmed_tokens = stemmed_tokens[:100] + ["xq"] + stemmed_tokens[101:]
+    alignment = align(gold_tokens, stemmed_tokens)
+    assert alignment.incompatible == 1
+    assert alignment.matched == len(stemmed_tokens) - 1
+    assert "1 incompatible" in alignment.summary()
+
+def test_unrelated_streams_stay_linear():
+    # Disjoint alphabets: no token can be a stem of any other, so every
+    # gap needs the most edits a diff can take
+    rng = random.Random(0)
+    gold_tokens = ["".join(rng.choices("abcdefghijklm", k=6)) for _ in range(4000)]
+    stemmed_tokens = ["".join(rng.choices("nopqrstuvwxyz", k=6)) for _ in range(4000)]
+    start = time.perf_counter()
+    alignment = align(gold_tokens, stemmed_tokens)
+    assert time.perf_counter() - start < 30
+    assert alignment.method == 'diff'
+    assert (alignment.matched, alignment.gold_only, alignment.stemmed_only) == (0, 4000, 4000)
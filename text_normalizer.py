@@ -0,0 +1,48 @@
+"""
+Single-pass text normalizers shared by the stemming and preprocessing scripts.
+
+Each replaces a chain of full-string re.sub/translate passes with one
+lowercase, one scan of a combined regex and one split/join, and gives
+exactly the output of the sequential passes.
+"""
+import re
+import string
+
+_URL = r'https?://\S+|www\.\S+'
+
+# The sequential passes remove URLs before HTML tags, so a URL inside a tag
+# may swallow the '>' that seems to close it. A tag is therefore read as
+# URLs, taken whole, and other characters up to the first '>' outside a URL.
+_TAG = rf'<(?:(?=({_URL}))\1|(?!https?://\S|www\.\S)[^>\n])*?>'
+
+# Text for stemming: drop URLs, HTML tags and anything but a-z and whitespace.
+# A lone '<' comes last so that a tag is always tried first.
+_STEMMING = re.compile(rf'{_URL}|{_TAG}|[^a-z\s<]+|<')
+
+# Document text: drop URLs, HTML tags, ASCII punctuation and digits, and turn
+# runs of other non-ASCII characters into a space.
+_PUNCTUATION = re.escape(string.punctuation.replace('<', ''))
+_DOCUMENT = re.compile(
+    rf'{_URL}|{_TAG}|[{_PUNCTUATION}\d]+|<|(?P<wide>[^\x00-\x7F]+)'
+)
+
+# The URLs and tags both normalizers remove, and a '<' that is not (yet) a
+# tag; text_stream.safe_cut must not cut text inside any of them
+MARKUP = re.compile(rf'{_URL}|{_TAG}|<')
+
+def _document_repl(m):
+    return ' ' if m.lastgroup == 'wide' else ''
+
+def normalize_for_stemming(text):
+    """
+    Lowercase text, remove URLs, HTML tags and every character other than
+    a-z and whitespace, and collapse whitespace to single spaces.
+    """
+    return ' '.join(_STEMMING.sub('', text.lower()).split())
+
+def normalize_document(text):
+    """
+    Lowercase text, remove URLs, HTML tags, punctuation and digits, replace
+    other non-ASCII characters with spaces and collapse whitespace.
+    """
+    return ' '.join(_DOCUMENT.sub(_document_repl, text.lower()).split())
@@ -0,0 +1,234 @@
+"""
+Generator stages for stemming a file without holding it in memory:
+
+    read_chunks -> normalized_tokens -> filter_tokens -> stem_tokens -> write_joined
+
+Memory stays bounded by the chunk size plus the file's vocabulary.
+offset_tokens and filter_offset_tokens are the same first stages for when
+the byte offset of each token in the source file is needed too.
+"""
+import codecs
+import io
+import re
+from bisect import bisect_right
+from itertools import islice
+import numpy as np
+from stem_batch import stem_batch_unique
+from text_normalizer import MARKUP
+
+CHUNK_SIZE = 1 << 20
+# Longest run of text without a safe cut point that is carried between
+# chunks before it is cut anyway
+MAX_CARRY = 16 * CHUNK_SIZE
+
+def read_chunks(path, encoding, chunk_size=CHUNK_SIZE, errors='replace', digest=None):
+    """
+    Yield the decoded text of path in chunks, newlines translated as by
+    open(). With errors='strict' a byte that does not decode raises
+    UnicodeDecodeError, which checks the encoding in the same read; digest,
+    a hashlib object, is fed every byte read.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(errors), translate=True)
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(chunk_size)
+            if digest is not None:
+                digest.update(block)
+            chunk = decoder.decode(block, final=not block)
+            if chunk:
+                yield chunk
+            if not block:
+                return
+
+def _last_blank(text, start, end):
+    return max(text.rfind(' ', start, end), text.rfind('\t', start, end)) + 1
+
+def safe_cut(text):
+    """
+    Position up to which text can be normalized on its own, giving the same
+    tokens as normalizing it together with whatever follows.
+
+    Tokens and URLs end at whitespace and HTML tags (<.*?>) end at a
+    newline, so the last newline is always safe. Without one, cut after the
+    last space or tab that lies outside every URL and closed tag and before
+    the first '<' that may still open a tag, so that long single-line
+    markup is cut as it goes. Returns 0 when no safe point exists yet.
+    """
+    cut = text.rfind('\n') + 1
+    if cut:
+        return cut
+    lowered = text.lower()
+    end = len(text)
+    if len(lowered) != len(text):
+        # Lowercasing moved positions; only text before any markup is safe
+        found = text.find('<')
+        return _last_blank(text, 0, found if found >= 0 else end)
+    spans = []
+    for m in MARKUP.finditer(lowered):
+        if m.group() == '<':
+            end = m.start()
+            break
+        spans.append(m.span())
+    for start, stop in reversed(spans):
+        cut = _last_blank(text, stop, end)
+        if cut:
+            return cut
+        end = start
+    return _last_blank(text, 0, end)
+
+def normalized_tokens(chunks, preprocess, tokenize=str.split):
+    """
+    Yield tokens of preprocess(text) for text arriving in chunks. Text after
+    the last safe cut point of a chunk is carried into the next one, so no
+    token, URL or tag is split at a chunk boundary.
+    """
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk
+        cut = safe_cut(text)
+        if not cut and len(text) > MAX_CARRY:
+            cut = len(text)
+        carry = text[cut:]
+        if cut:
+            yield from tokenize(preprocess(text[:cut]))
+    if carry:
+        yield from tokenize(preprocess(carry))
+
+def filter_tokens(tokens, stop_words, min_len=3):
+    return (w for w in tokens if w not in stop_words and len(w) >= min_len)
+
+def filter_offset_tokens(pairs, stop_words, min_len=3):
+    """filter_tokens for the (token, offset) pairs of offset_tokens."""
+    return ((w, o) for w, o in pairs if w not in stop_words and len(w) >= min_len)
+
+_LINE = re.compile(rb'[^\r\n]+')
+_WORD = re.compile(rb'[^ \t\n\r\x0b\x0c]+')
+
+def _safe_cut_bytes(data, encoding):
+    """safe_cut for undecoded bytes of an ASCII-compatible encoding."""
+    cut = max(data.rfind(b'\n'), data.rfind(b'\r')) + 1
+    if cut:
+        return cut
+    # surrogateescape round-trips every byte, so the decoded prefix encodes
+    # back to exactly the bytes it came from
+    text = data.decode(encoding, errors='surrogateescape')
+    return len(text[:safe_cut(text)].encode(encoding, errors='surrogateescape'))
+
+def _segment_tokens(segment, base, encoding, preprocess, tokenize, errors):
+    for line in _LINE.finditer(segment):
+        line_start = base + line.start()
+        if b'<' in line.group():
+            # An HTML tag may span words here, so the line is normalized
+            # whole and its tokens get the offset of the line
+            for token in tokenize(preprocess(line.group().decode(encoding, errors))):
+                yield token, line_start
+            continue
+        # Elsewhere preprocess acts word by word, so each word's pieces can
+        # be traced back to it
+        pieces, owners = [], []
+        for word in _WORD.finditer(line.group()):
+            for piece in preprocess(word.group().decode(encoding, errors)).split():
+                pieces.append(piece)
+                owners.append(line_start + word.start())
+        if tokenize is str.split:
+            yield from zip(pieces, owners)
+            continue
+        starts = []
+        pos = 0
+        for piece in pieces:
+            starts.append(pos)
+            pos += len(piece) + 1
+        text = ' '.join(pieces)
+        pos = 0
+        for token in tokenize(text):
+            # Tokens of a-z text are substrings of it, in order
+            found = text.find(token, pos)
+            if found >= 0:
+                pos = found + len(token)
+            yield token, owners[bisect_right(starts, found if found >= 0 else pos) - 1]
+
+def ascii_compatible(encoding):
+    """
+    Whether every ASCII byte in encoding stands for that ASCII character,
+    as offset_tokens needs; not so for e.g. UTF-16 or stateful encodings.
+    """
+    name = codecs.lookup(encoding).name
+    if name.startswith(('utf-16', 'utf-32', 'utf-7', 'iso2022', 'hz')):
+        return False
+    try:
+        return bytes(range(128)).decode(name) == ''.join(map(chr, range(128)))
+    except UnicodeDecodeError:
+        return False
+
+def offset_tokens(path, encoding, preprocess, tokenize=str.split, chunk_size=CHUNK_SIZE, errors='replace',
+                  digest=None):
+    """
+    Yield the tokens normalized_tokens(read_chunks(path, encoding), preprocess,
+    tokenize) yields, each as (token, offset): the byte offset in the file of
+    the whitespace-separated word it came from, or of its line if that line
+    holds a '<'. The encoding must be ASCII-compatible. errors and digest
+    are as for read_chunks; every non-ASCII byte lies in a word or line that
+    is decoded, so errors='strict' checks the whole file.
+    """
+    with open(path, 'rb') as f:
+        carry = b''
+        base = 0
+        if codecs.lookup(encoding).name == 'utf-8-sig':
+            # Only a BOM at the start of the file is one; skip it there and
+            # decode every chunk after it as plain UTF-8, which would
+            # otherwise count the BOM into each chunk it encodes back
+            encoding = 'utf-8'
+            bom = f.read(len(codecs.BOM_UTF8))
+            if bom == codecs.BOM_UTF8:
+                base = len(bom)
+                if digest is not None:
+                    digest.update(bom)
+            else:
+                f.seek(0)
+        while True:
+            chunk = f.read(chunk_size)
+            if digest is not None:
+                digest.update(chunk)
+            data = carry + chunk
+            cut = _safe_cut_bytes(data, encoding) if chunk else len(data)
+            if not cut and len(data) > MAX_CARRY:
+                cut = len(data)
+            if cut:
+                yield from _segment_tokens(data[:cut], base, encoding, preprocess, tokenize, errors)
+            carry = data[cut:]
+            base += cut
+            if not chunk:
+                return
+
+def stem_tokens(tokens, stem, w2s, batch_size=4096):
+    """
+    Yield the stem of each token, recording every word -> stem in w2s.
+    Tokens are stemmed batch_size at a time, each distinct word of a batch
+    once (stem_batch.stem_batch_unique).
+    """
+    tokens = iter(tokens)
+    while True:
+        batch = list(islice(tokens, batch_size))
+        if not batch:
+            return
+        vocabulary, unique_stems, inverse = stem_batch_unique(stem, batch)
+        w2s.update(zip(vocabulary, unique_stems))
+        yield from np.array(unique_stems, dtype=object)[inverse].tolist()
+
+def write_joined(out, words, batch_size=4096):
+    """
+    Write words separated by single spaces, batch_size words per write,
+    and return the number of words written.
+    """
+    batch = []
+    written = 0
+    for w in words:
+        batch.append(w)
+        if len(batch) >= batch_size:
+            out.write(("" if not written else " ") + " ".join(batch))
+            written += len(batch)
+            batch = []
+    if batch:
+        out.write(("" if not written else " ") + " ".join(batch))
+        written += len(batch)
+    return written
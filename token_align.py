@@ -0,0 +1,241 @@
+"""
+Alignment of a gold-standard token stream with a stemmed output stream.
+
+When the stemmer wrote a token index, the source offset of each stem
+names its gold token directly. Otherwise stemmed output may be one stem
+per gold token, or only the tokens the stemming pipeline kept
+(normalize_for_stemming, then filter_tokens). align() tries those ways of
+re-deriving which gold position each stemmed token came from in turn.
+One is taken if it accounts for the stream lengths and never pairs
+MAX_RUN tokens in a row that cannot be word and stem, which a shift of
+the streams would. Otherwise align() diffs the streams: tokens that occur
+once in each and are identical anchor them, and a Myers O(ND) diff that
+matches compatible tokens aligns the gaps between anchors, giving up on a
+gap (leaving it unaligned) past MAX_EDITS edits.
+"""
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from text_normalizer import normalize_for_stemming
+from text_stream import filter_tokens
+
+MAX_RUN = 3
+# Edits a Myers diff may spend on one gap between anchors before giving up on it
+MAX_EDITS = 128
+
+class Alignment:
+    """Matched (gold position, stemmed position) pairs of one file and how they were found."""
+
+    def __init__(self, method, gold_positions, stemmed_positions, n_gold, n_stemmed, incompatible=0):
+        """incompatible is how many of the pairs cannot be word and stem (wrong stems)."""
+        self.method = method
+        self.gold_positions = gold_positions
+        self.stemmed_positions = stemmed_positions
+        self.n_gold = n_gold
+        self.n_stemmed = n_stemmed
+        self.incompatible = incompatible
+
+    @property
+    def matched(self):
+        """Pairs whose stem is compatible with its word."""
+        return len(self.gold_positions) - self.incompatible
+
+    @property
+    def gold_only(self):
+        return self.n_gold - len(self.gold_positions)
+
+    @property
+    def stemmed_only(self):
+        return self.n_stemmed - len(self.stemmed_positions)
+
+    def pairs(self, gold_tokens, stemmed_tokens):
+        """The aligned (gold_tokens, stemmed_tokens) as two equal-length lists."""
+        return ([gold_tokens[i] for i in self.gold_positions],
+                [stemmed_tokens[j] for j in self.stemmed_positions])
+
+    def summary(self):
+        return (f"{self.method}, {self.matched} aligned, {self.incompatible} incompatible, "
+                f"{self.gold_only} gold-only, {self.stemmed_only} stemmed-only tokens")
+
+def pipeline_positions(gold_tokens, stop_words=frozenset(), min_len=3):
+    """Gold position of every token the stemming pipeline would stem, in order."""
+    return [
+        i for i, token in enumerate(gold_tokens)
+        for _ in filter_tokens(normalize_for_stemming(token).split(), stop_words, min_len)
+    ]
+
+def compatible(word, stem):
+    """Whether stem could plausibly be a stem of word (same word, or a part of it up to one edge letter)."""
+    if stem == word or stem in word:
+        return True
+    # Nasal assimilation (meN-/peN- + t -> n) or a final y -> i change the edge letter
+    return len(stem) > 3 and (stem[1:] in word or stem[:-1] in word)
+
+def consistent(gold_tokens, stemmed_tokens, gold_positions, stemmed_positions, max_run=MAX_RUN):
+    """Whether the pairing never has max_run incompatible pairs in a row."""
+    run = 0
+    for i, j in zip(gold_positions, stemmed_positions):
+        if compatible(gold_tokens[i], stemmed_tokens[j]):
+            run = 0
+        else:
+            run += 1
+            if run >= max_run:
+                return False
+    return True
+
+def incompatible_pairs(gold_tokens, stemmed_tokens, gold_positions, stemmed_positions):
+    """Number of pairs whose stem is not compatible() with its word."""
+    return sum(not compatible(gold_tokens[i], stemmed_tokens[j])
+               for i, j in zip(gold_positions, stemmed_positions))
+
+def unique_anchors(gold_tokens, stemmed_tokens):
+    """
+    (gold, stemmed) position pairs of the tokens that occur exactly once in
+    each stream, identical in both, that are in the same order in both:
+    the longest such chain.
+    """
+    gold_counts, stemmed_counts = Counter(gold_tokens), Counter(stemmed_tokens)
+    gold_at = {t: i for i, t in enumerate(gold_tokens) if gold_counts[t] == 1}
+    candidates = [(gold_at[t], j) for j, t in enumerate(stemmed_tokens)
+                  if stemmed_counts[t] == 1 and t in gold_at]
+    candidates.sort()
+    # Longest increasing subsequence of the stemmed positions
+    tails, tail_at, previous = [], [], []
+    for n, (_, j) in enumerate(candidates):
+        k = bisect_left(tails, j)
+        previous.append(tail_at[k - 1] if k else -1)
+        if k == len(tails):
+            tails.append(j)
+            tail_at.append(n)
+        else:
+            tails[k] = j
+            tail_at[k] = n
+    chain = []
+    n = tail_at[-1] if tail_at else -1
+    while n >= 0:
+        chain.append(candidates[n])
+        n = previous[n]
+    return chain[::-1]
+
+def myers_pairs(gold_tokens, stemmed_tokens, gold_start, gold_end, stemmed_start, stemmed_end,
+                max_edits=MAX_EDITS):
+    """
+    (gold, stemmed) position pairs that a shortest edit script between
+    gold_tokens[gold_start:gold_end] and stemmed_tokens[stemmed_start:stemmed_end]
+    keeps, compatible tokens counting as equal, or None if that script needs
+    more than max_edits edits. Takes O((N + M) D) time and O(D^2) memory for
+    D edits, so at most O((N + M) max_edits) and O(max_edits^2).
+    """
+    a, b = gold_tokens[gold_start:gold_end], stemmed_tokens[stemmed_start:stemmed_end]
+    n, m = len(a), len(b)
+    if not n or not m:
+        return []
+    offset = n + m + 1
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for d in range(min(n + m, max_edits) + 1):
+        # Furthest x on each diagonal k = x - y before this round, for backtracking
+        trace.append(v[offset - d - 1:offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and compatible(a[x], b[y]):
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                break
+        else:
+            continue
+        break
+    else:
+        return None
+
+    pairs = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        before = trace[d]
+        k = x - y
+        if k == -d or (k != d and before[k - 1 + d + 1] < before[k + 1 + d + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = before[prev_k + d + 1]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            pairs.append((gold_start + x, stemmed_start + y))
+        x, y = prev_x, prev_y
+    return pairs[::-1]
+
+def diff_positions(gold_tokens, stemmed_tokens, max_run=MAX_RUN, max_edits=MAX_EDITS):
+    """
+    Gold and stemmed positions of the pairs of a diff of the two streams:
+    unique_anchors(), myers_pairs() between them, slid into runs, and,
+    where a gap left between pairs is as long in both streams and shorter
+    than max_run, its tokens paired one to one as wrong stems. The result
+    is thus always consistent(). A gap between anchors that takes more
+    than max_edits edits to diff is left unaligned, so unrelated streams
+    cost O((N + M) max_edits) rather than O((N + M)^2).
+    """
+    n_gold, n_stemmed = len(gold_tokens), len(stemmed_tokens)
+    pairs = []
+    i = j = 0
+    for anchor in unique_anchors(gold_tokens, stemmed_tokens) + [(n_gold, n_stemmed)]:
+        pairs.extend(myers_pairs(gold_tokens, stemmed_tokens, i, anchor[0], j, anchor[1], max_edits) or [])
+        pairs.append(anchor)
+        i, j = anchor[0] + 1, anchor[1] + 1
+    pairs.pop()
+
+    # Of equally short diffs, prefer the one that keeps matches in runs: a
+    # pair off the diagonal of the pair before it slides onto that of the
+    # pair after it, where a repeated token allows
+    for x in range(len(pairs) - 2, -1, -1):
+        (gi, sj), (gn, sn) = pairs[x], pairs[x + 1]
+        if x and pairs[x - 1] == (gi - 1, sj - 1):
+            continue
+        if sn == sj + 1 and gn > gi + 1 and compatible(gold_tokens[gn - 1], stemmed_tokens[sj]):
+            pairs[x] = (gn - 1, sj)
+        elif gn == gi + 1 and sn > sj + 1 and compatible(gold_tokens[gi], stemmed_tokens[sn - 1]):
+            pairs[x] = (gi, sn - 1)
+
+    gold_positions, stemmed_positions = [], []
+    i = j = 0
+    for gi, sj in pairs + [(n_gold, n_stemmed)]:
+        if gi - i == sj - j < max_run:
+            gold_positions.extend(range(i, gi))
+            stemmed_positions.extend(range(j, sj))
+        gold_positions.append(gi)
+        stemmed_positions.append(sj)
+        i, j = gi + 1, sj + 1
+    gold_positions.pop()
+    stemmed_positions.pop()
+    return gold_positions, stemmed_positions
+
+def align(gold_tokens, stemmed_tokens, stop_words=frozenset(), min_len=3,
+          source_offsets=None, gold_offsets=None):
+    """
+    source_offsets are the byte offsets of the stemmed tokens' source words
+    from a token index, gold_offsets those of the gold tokens in the same
+    file; with both, each stem is paired with the gold token at its offset.
+    """
+    n_gold, n_stemmed = len(gold_tokens), len(stemmed_tokens)
+
+    def alignment(method, gold_positions, stemmed_positions):
+        return Alignment(method, gold_positions, stemmed_positions, n_gold, n_stemmed,
+                         incompatible_pairs(gold_tokens, stemmed_tokens, gold_positions, stemmed_positions))
+
+    stemmed_positions = list(range(n_stemmed))
+    if source_offsets is not None and gold_offsets is not None:
+        located = [bisect_right(gold_offsets, offset) - 1 for offset in source_offsets]
+        if min(located, default=0) >= 0 and consistent(gold_tokens, stemmed_tokens, located, stemmed_positions):
+            return alignment('index', located, stemmed_positions)
+    if n_gold == n_stemmed and consistent(gold_tokens, stemmed_tokens, stemmed_positions, stemmed_positions):
+        return alignment('one-to-one', stemmed_positions, stemmed_positions)
+    kept = pipeline_positions(gold_tokens, stop_words, min_len)
+    if len(kept) == n_stemmed and consistent(gold_tokens, stemmed_tokens, kept, stemmed_positions):
+        return alignment('pipeline', kept, stemmed_positions)
+    return alignment('diff', *diff_positions(gold_tokens, stemmed_tokens))
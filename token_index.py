@@ -0,0 +1,160 @@
+"""
+Binary token index written next to a stemmed output file (name.txt.idx).
+
+It holds every stemmed token of the output in order, so consumers can
+memory-map it and go straight to any token instead of re-splitting the
+output text:
+
+    header     magic, format version, id width, offset width, token count,
+               vocabulary size, blob size, source file size
+    token_ids  uint[n_tokens]        word each token was stemmed from
+    stem_ids   uint[n_tokens]        its stem
+    offsets    uint[n_tokens]        byte offset in the source file of the
+                                     word it came from (text_stream.offset_tokens)
+    vocab      uint[n_vocab + 1]     entry i is blob[vocab[i]:vocab[i + 1]]
+    blob       utf-8 words and stems, sorted
+
+Integers are little-endian. Ids are 2 bytes wide when every id and vocabulary
+offset fits, else 4; source offsets are 4 bytes wide, or 8 for sources of
+4 GiB and more.
+"""
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from binfmt import close_mapped, pack, uint_array
+
+SUFFIX = '.idx'
+
+_HEADER = struct.Struct("<4sHBBIIIQ")
+_MAGIC = b"STIX"
+_VERSION = 1
+
+def index_path(output_path):
+    return output_path + SUFFIX
+
+class IndexBuilder:
+    """
+    Collects (word, stem, offset) per token while a file is stemmed, by
+    passing the token and stem streams through tokens() and stems().
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.token_ids = array('I')
+        self.stem_ids = array('I')
+        self.offsets = array('Q')
+
+    def _id(self, word):
+        i = self.ids.get(word)
+        if i is None:
+            i = self.ids[word] = len(self.ids)
+        return i
+
+    def tokens(self, pairs):
+        """Yield the words of (word, offset) pairs, recording each."""
+        for word, offset in pairs:
+            self.token_ids.append(self._id(word))
+            self.offsets.append(offset)
+            yield word
+
+    def stems(self, stems):
+        """Yield stems unchanged, recording each."""
+        for stem in stems:
+            self.stem_ids.append(self._id(stem))
+            yield stem
+
+    def write(self, path, source_size):
+        vocab = sorted(self.ids)
+        # Renumber from first-seen order to sorted order
+        new_id = array('I', bytes(4 * len(vocab)))
+        for i, word in enumerate(vocab):
+            new_id[self.ids[word]] = i
+
+        encoded = [w.encode('utf-8') for w in vocab]
+        vocab_offsets = [0]
+        for b in encoded:
+            vocab_offsets.append(vocab_offsets[-1] + len(b))
+        blob = b"".join(encoded)
+        id_width = 2 if max(len(blob), len(vocab)) < 1 << 16 else 4
+        offset_width = 4 if source_size < 1 << 32 else 8
+
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, id_width, offset_width,
+                                 len(self.token_ids), len(vocab), len(blob), source_size))
+            f.write(pack((new_id[i] for i in self.token_ids), id_width))
+            f.write(pack((new_id[i] for i in self.stem_ids), id_width))
+            f.write(pack(self.offsets, offset_width))
+            f.write(pack(vocab_offsets, id_width))
+            f.write(blob)
+
+class TokenIndex:
+    """Read-only, memory-mapped view over a token index."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, id_width, offset_width,
+         n_tokens, n_vocab, blob_len, source_size) = _HEADER.unpack_from(self._buf)
+        if magic != _MAGIC or version != _VERSION or id_width not in (2, 4) or offset_width not in (4, 8):
+            raise ValueError(f"{path} is not a version {_VERSION} token index")
+        self.n_tokens = n_tokens
+        self.n_vocab = n_vocab
+        self.source_size = source_size
+
+        pos = _HEADER.size
+        self._token_ids, pos = uint_array(self._buf, pos, n_tokens, id_width)
+        self._stem_ids, pos = uint_array(self._buf, pos, n_tokens, id_width)
+        self._offsets, pos = uint_array(self._buf, pos, n_tokens, offset_width)
+        self._vocab, pos = uint_array(self._buf, pos, n_vocab + 1, id_width)
+        self._blob = memoryview(self._buf)[pos:pos + blob_len]
+
+    def __len__(self):
+        return self.n_tokens
+
+    def vocab(self, word_id):
+        return str(self._blob[self._vocab[word_id]:self._vocab[word_id + 1]], 'utf-8')
+
+    def vocab_id(self, word):
+        """Id of word in the vocabulary, or None."""
+        i = bisect_left(range(self.n_vocab), word, key=self.vocab)
+        if i < self.n_vocab and self.vocab(i) == word:
+            return i
+        return None
+
+    def token(self, i):
+        return self.vocab(self._token_ids[i])
+
+    def stem(self, i):
+        return self.vocab(self._stem_ids[i])
+
+    def offset(self, i):
+        return self._offsets[i]
+
+    def tokens(self):
+        vocab = [self.vocab(i) for i in range(self.n_vocab)]
+        return [vocab[i] for i in self._token_ids]
+
+    def stems(self):
+        vocab = [self.vocab(i) for i in range(self.n_vocab)]
+        return [vocab[i] for i in self._stem_ids]
+
+    def offsets(self):
+        return self._offsets.tolist()
+
+    def close(self):
+        close_mapped(self._buf, self._token_ids, self._stem_ids, self._offsets, self._vocab, self._blob)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_index(output_path):
+    """The token index of an output file if it exists and is up to date, else None."""
+    path = index_path(output_path)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(output_path):
+        return TokenIndex(path)
+    return None